@@ -6,6 +6,7 @@ usage   : library of variables for runner.py
 """
 import argparse
 from src.questions.Question import *
+from src.parseCache import DEFAULT_CACHE_DIR
 
 
 folder_key = '-folder'
@@ -15,13 +16,25 @@ run_time_to_detection_key = '-ttd'
 skip_questions_key = '-skipq'
 exclude_adsb_key = '-noadsb'
 exclude_gpx_key = '-nogpx'
+workers_key = '-workers'
+cache_dir_key = '-cachedir'
+no_cache_key = '--no-cache'
+rebuild_cache_key = '--rebuild-cache'
+jobs_key = '--jobs'
+block_gap_key = '-blockgap'
+frequency_window_key = '-freqwindow'
 
 INDEPENDENTS_to_run = range(0, len(INDEPENDENTS)-1, 1)
 DEPENDENTS_to_run = range(0, len(DEPENDENTS)-1, 1)
 
-CLI = argparse.ArgumentParser()
+"""
+INPUT : argv - the arguments to parse (default: the command line)
+OUTPUT: the parsed arguments of one runner.py run.  Each call builds a fresh
+        parser, so campaign.py can parse one set of arguments per day.
+"""
+def parse(argv=None):
+    CLI = argparse.ArgumentParser()
 
-def parse():
     # Arguments can be added here
     CLI.add_argument(
         folder_key,
@@ -57,8 +70,47 @@ def parse():
         skip_questions_key,
         action='store_true'
     )
+    # Number of processes used to parse log files (0 = one per CPU core)
+    CLI.add_argument(
+        workers_key,
+        type=int,
+        default=1
+    )
+    # Parsed logs are cached on disk; see src/parseCache.py
+    CLI.add_argument(
+        cache_dir_key,
+        type=str,
+        default=DEFAULT_CACHE_DIR
+    )
+    CLI.add_argument(
+        no_cache_key,
+        action='store_true'
+    )
+    CLI.add_argument(
+        rebuild_cache_key,
+        action='store_true'
+    )
+    # Number of processes used to answer questions and save their plots
+    CLI.add_argument(
+        jobs_key,
+        type=int,
+        default=1
+    )
+    # Minutes without a radar point that end one block and start the next
+    CLI.add_argument(
+        block_gap_key,
+        type=float,
+        default=10
+    )
+    # Seconds either side of a radar point in which the frequency questions
+    # count other valid (or invalid) points
+    CLI.add_argument(
+        frequency_window_key,
+        type=float,
+        default=1
+    )
 
-    return CLI.parse_args()
+    return CLI.parse_args(argv)
 
 
 
@@ -0,0 +1,170 @@
+"""
+file    : campaign.py
+author  : Max von Hippel
+authored: 18 October 2026
+usage   : python3 campaign.py -folders <day folder or flight-test tree> ...
+                              [--day-jobs N] [-out folder] [runner options]
+purpose : Run runner.py's analysis over many flight-test days in one go.
+          Interpreter startup and the heavy imports are paid once per worker
+          rather than once per day, and each worker keeps its parse cache,
+          config index, radar resolver and RadarConfig timelines from one day
+          to the next.  Each day's printout goes to <out>/<day>.log, and one
+          line per day to <out>/summary.csv.
+"""
+import argparse
+import contextlib
+import csv
+import io
+import os
+import re
+import time
+import traceback
+
+import argumentKeys as argKeys
+import runner
+
+from concurrent.futures import ProcessPoolExecutor
+from src.folderScan     import forgetScans
+from src.parseCache     import ParseCache
+
+
+# Day folders are named after their date, e.g. 2021.01.25.Day1 or
+# 2021.04.21; flight-test folders (2021.01.22-01.29.FlightTest1) are not.
+DAY_FOLDER = re.compile(r"^\d{4}\.\d{2}\.\d{2}(\.|$)")
+
+SUMMARY_FIELDS = [
+    "folder",
+    "status",
+    "seconds",
+    "radar points",
+    "truth points",
+    "blocks",
+    "ttd",
+    "questions",
+    "memo hits",
+    "memo misses"
+]
+
+
+# The day folders in or under each of folders (e.g. the whole UAF-VAS-FAA
+# tree), in name order.  A folder with no day folders under it is taken to be
+# a day itself.
+def dayFolders(folders):
+    days = []
+    for folder in folders:
+        found = []
+        for (root, dirs, files) in os.walk(folder):
+            dirs.sort()
+            found += [
+                os.path.join(root, d, "") for d in dirs if DAY_FOLDER.match(d)
+            ]
+            # Whatever is inside a day belongs to that day.
+            dirs[:] = [d for d in dirs if not DAY_FOLDER.match(d)]
+        days += found if len(found) > 0 else [folder]
+    return days
+
+
+# One ParseCache per cache folder per process, shared by every day it runs.
+_CACHES = {}
+
+def _parseCache(args):
+    if args.no_cache:
+        return None
+    key = (args.cachedir, args.rebuild_cache)
+    if key not in _CACHES:
+        _CACHES[key] = ParseCache(args.cachedir, args.rebuild_cache)
+    return _CACHES[key]
+
+
+# Run one day, given its runner.py arguments.  Returns (summary, printout);
+# a day that fails is reported as such instead of stopping the campaign.  The
+# day's folder is walked afresh, so a log that changed since an earlier day
+# was run in this worker is not taken from the parse cache.
+def runDay(argv):
+    forgetScans()
+    args  = argKeys.parse(argv)
+    out   = io.StringIO()
+    start = time.time()
+    with contextlib.redirect_stdout(out):
+        try:
+            summary = runner.run(args, cache=_parseCache(args))
+            summary["status"] = "ok"
+        except Exception:
+            traceback.print_exc(file=out)
+            summary = { "folder" : args.folder[0], "status" : "failed" }
+    summary["seconds"] = round(time.time() - start, 1)
+    return summary, out.getvalue()
+
+
+def _logName(day):
+    return os.path.basename(os.path.normpath(day)) + ".log"
+
+
+def main(argv=None):
+
+    CLI = argparse.ArgumentParser(
+        description="Run runner.py over many days; any option not listed "
+                    "here is passed on to runner.py for every day.")
+    CLI.add_argument(
+        "-folders",
+        nargs="+",
+        type=str,
+        required=True
+    )
+    # Number of days analysed at the same time (each in its own process)
+    CLI.add_argument(
+        "--day-jobs",
+        type=int,
+        default=1
+    )
+    CLI.add_argument(
+        "-out",
+        type=str,
+        default="campaign"
+    )
+
+    (args, runnerArgs) = CLI.parse_known_args(argv)
+
+    days  = dayFolders(args.folders)
+    argvs = [[argKeys.folder_key, day] + runnerArgs for day in days]
+
+    print("Running campaign over " + str(len(days)) + " days ...")
+
+    os.makedirs(args.out, exist_ok=True)
+
+    start = time.time()
+
+    if args.day_jobs <= 1 or len(days) <= 1:
+        results = map(runDay, argvs)
+        pool    = None
+    else:
+        pool    = ProcessPoolExecutor(max_workers=min(args.day_jobs, len(days)))
+        results = pool.map(runDay, argvs)
+
+    with open(os.path.join(args.out, "summary.csv"), "w", newline="") as fw:
+
+        writer = csv.DictWriter(fw, fieldnames=SUMMARY_FIELDS, restval="",
+                                extrasaction="ignore")
+        writer.writeheader()
+
+        for (day, (summary, printout)) in zip(days, results):
+
+            with open(os.path.join(args.out, _logName(day)), "w") as log:
+                log.write(printout)
+
+            writer.writerow(summary)
+            fw.flush()
+
+            print("[" + summary["status"] + "] " + day + " (" \
+                  + str(summary["seconds"]) + " s)")
+
+    if pool != None:
+        pool.shutdown()
+
+    print("Campaign took " + str(round(time.time() - start, 1)) + " s")
+
+    print("DONE")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,56 +4,75 @@ author  : Max von Hippel;PP
 authored: 4 July 2021
 usage   : python3 runner.py demo-data
 """
+import os
 import sys
 import argumentKeys as argKeys
 
+from datetime               import timedelta
+
 from src.radarData          import RadarData
 from src.blocks             import radarTruthBlocks
+from src.parseCache         import ParseCache
+from src.radarResolver      import getRadarResolver, RESOLVER_CACHE_FILE
 from src.truthData          import *
 from src.questions.Question import *
 from src.questions.TimeToDetect import *
+from src.questions.questionPool import answerQuestions
 
 
 TRIVIAL_THRESHOLD = 4
 
 
-def main():
+# Run the whole analysis on one folder.  args is what argumentKeys.parse
+# gives; cache, if given, is a ParseCache to share with other runs (see
+# campaign.py).  Returns a summary of the run, as a dict.
+def run(args, cache=None):
 
     print("Running analysis ...")
 
-    args = argKeys.parse()
     argKeyList = list(vars(args).keys())
 
     # We begin by finding all of the data.
     input_folder = args.folder[0]
 
+    summary = { "folder" : input_folder }
+
+    workers = args.workers
+    if cache == None and not args.no_cache:
+        cache = ParseCache(args.cachedir, args.rebuild_cache)
+
+    if not args.no_cache:
+        getRadarResolver().useCache(
+            os.path.join(args.cachedir, RESOLVER_CACHE_FILE),
+            args.rebuild_cache)
+
     print("Reading in radar data from " + input_folder)
 
-    radarD = RadarData(input_folder)
+    radarD = RadarData(input_folder, workers=workers, cache=cache)
 
     print("Reading in truth data from " + input_folder)
     
     if args.noadsb:
     
-        nmeaD = NMEAData   (input_folder)
-        gpxD  = GPXData    (input_folder)
-        mavlD = MavlinkData(input_folder)
+        nmeaD = NMEAData   (input_folder, workers=workers, cache=cache)
+        gpxD  = GPXData    (input_folder, workers=workers, cache=cache)
+        mavlD = MavlinkData(input_folder, workers=workers, cache=cache)
 
         truthD = gpxD.union(nmeaD) \
                      .union(mavlD)
     elif args.nogpx:
     
-        adsbD = ADSBData   (input_folder)
-        nmeaD = NMEAData   (input_folder)
-        mavlD = MavlinkData(input_folder)
+        adsbD = ADSBData   (input_folder, workers=workers, cache=cache)
+        nmeaD = NMEAData   (input_folder, workers=workers, cache=cache)
+        mavlD = MavlinkData(input_folder, workers=workers, cache=cache)
 
         truthD = adsbD.union(nmeaD) \
                       .union(mavlD)
     else:
-        adsbD  = ADSBData   (input_folder)
-        nmeaD  = NMEAData   (input_folder)
-        gpxD   = GPXData    (input_folder)
-        mavlD  = MavlinkData(input_folder)
+        adsbD  = ADSBData   (input_folder, workers=workers, cache=cache)
+        nmeaD  = NMEAData   (input_folder, workers=workers, cache=cache)
+        gpxD   = GPXData    (input_folder, workers=workers, cache=cache)
+        mavlD  = MavlinkData(input_folder, workers=workers, cache=cache)
 
         truthD = adsbD.union(nmeaD)\
                       .union(gpxD)\
@@ -75,6 +94,9 @@ def main():
 
     print(truthD.quickStats())
 
+    summary["radar points"] = sum(len(t) for t in radarD.getPoints().values())
+    summary["truth points"] = len(truthD.getPoints())
+
     print("Computing blocks ...")
 
     # TODO: Add code that makes sure truth data from different sources ends up 
@@ -82,8 +104,12 @@ def main():
     # TODO: Add code that makes sure radar data from different radars ends up in 
     #       different data blocks
 
-    # Now that we have truth and radar, let's bin it up into blocks.
-    BLOCKS = radarTruthBlocks(radarD.getPoints(), truthD.getPoints())
+    # Now that we have truth and radar, let's bin it up into blocks, leaving
+    # out singletons and empty sets as we go.
+    BLOCKS = radarTruthBlocks(radarD.getPoints(),
+                              truthD.getPoints(),
+                              gap=timedelta(minutes=args.blockgap),
+                              minimum=TRIVIAL_THRESHOLD)
 
     BLOCKED_DATAS = [
         (RadarData(folder=None, points=radarBlock),
@@ -92,44 +118,30 @@ def main():
         for (radarBlock, truthBlock) in BLOCKS
     ]
 
-    # Remove singletons and empty sets.
-    BLOCKED_DATAS = [
-        
-        (RD, TD) for (RD, TD) in BLOCKED_DATAS
-        
-        if RD.isNonTrivial(TRIVIAL_THRESHOLD) and
-           TD.isNonTrivial(TRIVIAL_THRESHOLD)
-    ]
+    summary["blocks"] = len(BLOCKED_DATAS)
 
     if args.ttd:
 
         print("Running ttd analysis ...")
 
+        summary["ttd"] = 0
+
         for (RD, TD) in BLOCKED_DATAS:
 
+            # Each split is one sort of the block by source, then stamp;
+            # every sub-RD / sub-TD is a view of its source's stretch.
             print("Computing blocked subRDs ...")
 
-            RD_srcs = set([p.src for p in RD.points])
-            subRDs = [ RD ] if ( len(RD_srcs) <= 1 ) else [
-                RadarData(
-                    folder=None, 
-                    points=[p for p in RD.points if p.src == s])
-                for s in RD_srcs
-            ]
+            subRDs = list(RD.groupBySrc().values())
 
             print("Computing blocked subTDs ...")
 
-            TD_srcs = set([t.src for t in TD.points])
-            subTDs = [ TD ] if ( len(TD_srcs) <= 1 ) else [
-                TruthData(
-                    folder=None, 
-                    points=[t for t in TD.points if t.src == s])
-                for s in TD_srcs
-            ]
+            subTDs = list(TD.groupBySrc().values())
 
             for _RD in subRDs:
                 for _TD in subTDs:
                     answer = TimeToDetect(_RD, _TD)
+                    summary["ttd"] += len(answer.time_to_detect)
                     if len(answer.time_to_detect) > 0:
                         rdSrc = _RD.points[0].src
                         tdSrc = _TD.points[0].src
@@ -140,36 +152,42 @@ def main():
                                 str(a.total_seconds()) 
                                 for a 
                                 in answer.time_to_detect]))
-        pass
+
+        getRadarResolver().save()
 
 
     if args.skipq:
-        return
+        return summary
     
-    # Finally, let's answer some questions, over the various blocks.
-    for (RD, TD) in BLOCKED_DATAS:
+    # Finally, let's answer some questions, over the various blocks.  Each
+    # parser runs once per block (per process); the memo hands its answer to 
+    # every question that needs it.
+    units = [
+        (block, countI, countD)
+        for block in range(len(BLOCKED_DATAS))
+        for countI in range(len(INDEPENDENTS))
+        for countD in range(len(DEPENDENTS))
+        if countI in args.independents and countD in args.dependents
+    ]
 
-        for countI, (independent_parser, \
-                     independent_name) in enumerate(INDEPENDENTS):
+    memo = ParserMemo()
 
-            for countD, (dependent_parser, \
-                         dependent_name) in enumerate(DEPENDENTS):
+    answerQuestions(BLOCKED_DATAS, units, jobs=args.jobs, memo=memo,
+                    dependents=dependentsWithWindow(args.freqwindow))
 
-                if countI in args.independents and countD in args.dependents:
+    print(memo.quickStats())
 
-                    timestamped_INDEPENDENT = independent_parser(RD, TD)
-                    timestamped_DEPENDENT   = dependent_parser(RD, TD)
+    summary["questions"]   = len(units)
+    summary["memo hits"]   = memo.hits
+    summary["memo misses"] = memo.misses
 
-                    answer = Question(
-                        timestamped_X=timestamped_INDEPENDENT,
-                        timestamped_Y=timestamped_DEPENDENT,
-                        X_axis_name=independent_name,
-                        Y_axis_name=dependent_name)
+    print("DONE")
 
-                    if answer.isNonTrivial():
-                        answer.plotXY(save=True)
+    return summary
 
-    print("DONE")
+
+def main():
+    run(argKeys.parse())
 
 
 if __name__ == "__main__":
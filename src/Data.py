@@ -4,10 +4,21 @@ author  : Max von Hippel
 authored: 4 July 2021
 purpose : provides an abstract class for data
 """
+from src.timeIndex import toStamp64
 
 class Data:
+
+	# How many processes fromFolder may use to parse files (see src/ingest.py)
+	workers = 1
+
+	# Where fromFolder may find already-parsed files (see src/parseCache.py)
+	cache   = None
+
 	# Should initialize the Data
-	def __init__(self, folder=None, points=None):
+	def __init__(self, folder=None, points=None, workers=1, cache=None):
+
+		self.workers = workers
+		self.cache   = cache
 
 		# We don't want to double check that the points come
 		# from the folder, so, we should expect just one or the
@@ -35,6 +46,47 @@ class Data:
 	def getPoints(self):
 		return self.points
 
+	# The points of a Data are either one table, or (for RadarData) a dict of
+	# tables by source; the time queries below work on either.
+
+	# Should return the points with t0 <= stamp <= t1, as the same kind of Data
+	def slice_time(self, t0, t1):
+		points = self.getPoints()
+		if isinstance(points, dict):
+			points = {k : v.sliceTime(t0, t1) for k, v in points.items()}
+		else:
+			points = points.sliceTime(t0, t1)
+		return type(self)(points=points, workers=self.workers, cache=self.cache)
+
+	# Should return the point closest in time to t, or None
+	def nearest(self, t):
+		points = self.getPoints()
+		tables = points.values() if isinstance(points, dict) else [points]
+		t      = toStamp64(t)
+		best   = None
+		for table in tables:
+			p = table.nearest(t)
+			if p == None:
+				continue
+			d = abs(toStamp64(p.stamp) - t)
+			if best == None or d < best[0]:
+				best = (d, p)
+		return None if best == None else best[1]
+
+	# Should return { src : the points from that source, as the same kind of
+	# Data }.  A single table is split once (see TrackTable.srcRanges) and
+	# each part is a view, not a copy.
+	def groupBySrc(self):
+		points = self.getPoints()
+		tables = points.values() if isinstance(points, dict) else [points]
+		groups = {}
+		for table in tables:
+			for (src, group) in table.groupBySrc().items():
+				groups[src] = type(self)(points=group,
+					                     workers=self.workers,
+					                     cache=self.cache)
+		return groups
+
 	# Should return some quick stats, for debugging.
 	def quickStats(self):
 		return ""
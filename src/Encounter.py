@@ -5,9 +5,23 @@ authored: 4 August 2021
 purpose : A class that holds information associated with an encounter
 """
 from src.mathUtils import PAC
+from src.pacIndex  import PACIndex
+from src.record    import Record
 from datetime import timedelta
 
-class Encounter():
+class Encounter(Record):
+
+    __slots__ = (
+        "TD_sequence",
+        "TD_point",
+        "RD_sequence",
+        "first_valid_RD_point_location",
+        "RD_passed_PAC",
+        "PAC_hoz_deviation",
+        "PAC_vert_deviation",
+        "PAC_time_deviation"
+    )
+
     def __init__(self, TD_point,
                  RD_sequence,
                  TD_sequence = None,
@@ -37,12 +51,12 @@ class Encounter():
 
 
     def append_general_PAC_test(self):
+        truth_index = PACIndex(self.TD_sequence)
         for id, RD_point in enumerate(self.RD_sequence):
-            self.RD_sequence[id].PAC_results = PAC(RD_point.stamp,
+            self.RD_sequence[id].PAC_results = truth_index.query(RD_point.stamp,
                                                    RD_point.latitude,
                                                    RD_point.longitude,
                                                    RD_point.altitude,
-                                                   self.TD_sequence,
                                                    allowed_hoz_deviation=self.PAC_hoz_deviation,
                                                    allowed_vertical_deviation=self.PAC_vert_deviation,
                                                    allowed_time_deviation=self.PAC_time_deviation
@@ -4,5 +4,35 @@ author     : Levi Purdy
 authored   : 02 August 2021
 description: Place holder class describing the field of view of a radar
 """
-class FoV(object):
-	pass
\ No newline at end of file
+from src.record import Record
+
+class FoV(Record):
+
+	__slots__ = (
+		"range",
+		"rangeUnit",
+		"minRange",
+		"AzMin",
+		"AzMinUnit",
+		"AzMax",
+		"AzMaxUnit",
+		"ElMin",
+		"ElMinUnit",
+		"ElMax",
+		"ElMaxUnit"
+	)
+
+"""
+The answer is_point_in_fov (and FoVClassifier) gives for one truth point.
+"""
+class FoVTest(Record):
+
+	__slots__ = (
+		"range",
+		"is_in_range",
+		"is_in_fov",
+		"relative_heading",
+		"relative_elevation",
+		"is_in_heading",
+		"is_in_elevation"
+	)
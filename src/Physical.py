@@ -4,5 +4,24 @@ author     : Levi Purdy
 authored   : 02 August 2021
 description: Place holder class describing the physical properites of a radar.
 """
-class Physical(object):
-	pass
\ No newline at end of file
+from src.record import Record
+
+class Physical(Record):
+
+	__slots__ = (
+		"lat",
+		"lon",
+		"alt",
+		"heading",
+		"pitch",
+		"roll",
+		"latUnit",
+		"lonUnit",
+		"altUnit",
+		"headingUnit",
+		"pitchUnit",
+		"rollUnit",
+		"label",
+		"scriptPath",
+		"fov"
+	)
@@ -4,5 +4,26 @@ author     : Max von Hippel, but not really, it's Levi's brilliant idea :D
 authored   : 31 July 2021
 description: Better than a tuple!
 """
-class Point(object):
-	pass
\ No newline at end of file
+from src.record import Record
+
+class Point(Record):
+
+	# The sample fields every Point carries (see src/record.py); anything else
+	# set on a Point, e.g. TimeToDetect's fov_test, lives in its __dict__.
+	__slots__ = (
+		# radar and truth samples, in the order TrackTable fills them in
+		"stamp",
+		"src",
+		"confidence",
+		"latitude",
+		"longitude",
+		"altitude",
+		"distance",
+		"verticalVelocity",
+		"xVelocity",
+		"yVelocity",
+		"azimuth",
+		"elevation",
+		"range",
+		"trackID"
+	)
@@ -3,49 +3,87 @@ file   : blocks.py
 author : Max von Hippel
 purpose: Split data into temporal blocks (ie encounters)
 """
-from src.mathUtils import PAC
+import numpy as np
 
-def blockSplitTimeIndexedData(data):
-	if len(data) == 0:
+from datetime     import timedelta
+from src.pacIndex import PACIndex
+
+# Consecutive points further apart than this start a new block.
+BLOCK_GAP = timedelta(minutes=10)
+
+"""
+INPUT : stamps  - sorted datetime64 array (NaT last, as np.sort leaves it)
+        gap     - a timedelta; a larger jump between neighbours splits blocks
+        minimum - only keep blocks with more than this many points
+OUTPUT: [ ... (start, end) ... ], the index range of each block
+"""
+def blockRanges(stamps, gap=BLOCK_GAP, minimum=0):
+	n = len(stamps)
+	if n == 0:
 		return []
-	sorted_data = sorted(data, key=lambda d : d.stamp)
-	blocks = [[sorted_data[0]]]
-	data_length = len(data)
-	for j in range(1, data_length):
-		
-		if ((sorted_data[j    ].stamp - \
-			 sorted_data[j - 1].stamp).total_seconds() / 60) > 10:
+	# NaT differences compare False, so unstamped points join the last block.
+	splits = np.flatnonzero(np.diff(stamps) > np.timedelta64(gap)) + 1
+	starts = np.concatenate(([0], splits))
+	ends   = np.concatenate((splits, [n]))
+	keep   = ends - starts > minimum
+	return list(zip(starts[keep].tolist(), ends[keep].tolist()))
+
+"""
+OUTPUT: the table sorted by stamp; the table itself when it already is
+"""
+def _sortedTable(data):
+	index = data.timeIndex()
+	return data if index.monotonic else data.take(index.order)
+
+"""
+INPUT : data    - a RadarTable or TruthTable
+        gap     - see blockRanges
+        minimum - see blockRanges
+OUTPUT: [ ... block ... ], each block a view of a stretch of the sorted table
+"""
+def blockSplitTimeIndexedData(data, gap=BLOCK_GAP, minimum=0):
+	sorted_data = _sortedTable(data)
+	return [
+		sorted_data[s:e]
+		for (s, e) in blockRanges(sorted_data.stamp, gap, minimum)
+	]
 
-			blocks.append([sorted_data[j]])
-		else:
-			blocks[-1].append(sorted_data[j])
-	return blocks
+def _count(positions):
+	if isinstance(positions, slice):
+		return positions.stop - positions.start
+	return len(positions)
 
-def radarTruthBlocks(radar_data, truth_data):
+"""
+INPUT : radar_data - { radar file : RadarTable }
+        truth_data - a TruthTable
+        gap        - see blockRanges
+        minimum    - drop any block whose radar or truth part has this many
+                     points or fewer (runner.py's TRIVIAL_THRESHOLD)
+OUTPUT: [ ... (radar block, truth block) ... ]
+"""
+def radarTruthBlocks(radar_data, truth_data, gap=BLOCK_GAP, minimum=0):
 
 	BLOCKS = []
 
+	truth_index = truth_data.timeIndex()
+
 	for radar_file_name in radar_data:
 
-		if len(radar_data[radar_file_name]) == 0:
-			continue
+		radar_table = _sortedTable(radar_data[radar_file_name])
 
-		radar_file_blocks = blockSplitTimeIndexedData(\
-			                    radar_data[radar_file_name])
-		
-		truth_file_blocks = []
+		for (s, e) in blockRanges(radar_table.stamp, gap, minimum):
 
-		for radar_block in radar_file_blocks:
+			radar_block = radar_table[s:e]
 
-			mintime = radar_block[ 0].stamp
-			maxtime = radar_block[-1].stamp
+			mintime = radar_block.stamp[ 0]
+			maxtime = radar_block.stamp[-1]
 
-			truth_block = [
-				p for p in truth_data
-				if ((mintime <= p.stamp) and (p.stamp <= maxtime))
-			]
+			truth_rows = truth_index.between(mintime, maxtime)
 
-			BLOCKS.append((radar_block, truth_block))
+			if _count(truth_rows) <= minimum:
+				continue
+
+			BLOCKS.append((radar_block, truth_data.take(truth_rows)))
 
 	return BLOCKS
 
@@ -54,6 +92,11 @@ def flattenedRadarTruthBlock(radar_truth_block):
 
 	(radar_block, truth_block) = radar_truth_block
 
+	pac = PACIndex(truth_block).test(radar_block.stamp,
+		                             radar_block.latitude,
+		                             radar_block.longitude,
+		                             radar_block.altitude)
+
 	flattened_block = [
 		(point.stamp, 
 		 point.confidence, 
@@ -61,12 +104,8 @@ def flattenedRadarTruthBlock(radar_truth_block):
 		 point.longitude, 
 		 point.altitude, 
 		 point.distance, 
-		 PAC(point.stamp, 
-			 point.latitude, 
-			 point.longitude, 
-			 point.altitude, 
-			 truth_block))
-	    for point in radar_block
+		 valid)
+	    for (point, valid) in zip(radar_block, pac.tolist())
 	]
 
 	return flattened_block
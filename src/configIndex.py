@@ -0,0 +1,236 @@
+"""
+file    : configIndex.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : Parse every *_config.log and *RadarConfig*.json file once, and answer
+          the name / receiver location / EchoFlight-vs-EchoGuard / pitch-and-
+          roll questions the data classes keep asking from memory.
+"""
+import json
+import geopy.distance
+
+from src.folderScan import scanFolder
+
+"""
+Everything we need from one *_config.log file.  The raw text is kept only as
+the two flags isEchoFlight looks for, since those are plain substring tests
+that work even when the JSON is broken.
+"""
+class LogConfig(object):
+
+	def __init__(self, config_file_name):
+		self.file       = config_file_name
+		self.stuff      = None
+		self.exists     = False
+		self.echoguard  = False
+		self.echoflight = False
+		try:
+			with open(config_file_name, "r") as fr:
+				txt = fr.read()
+		except Exception as e:
+			return
+		self.exists     = True
+		self.echoguard  = "echoguard"  in txt.lower()
+		self.echoflight = "echoflight" in txt.lower()
+		try:
+			self.stuff = json.loads(txt)
+		except Exception as e:
+			self.stuff = None
+
+class ConfigIndex(object):
+
+	def __init__(self):
+		self.logConfigs        = {} # config file name -> LogConfig
+		self.receivers         = {} # config file name -> receiver, or None
+		self.radarConfigs      = {} # RadarConfig file name -> JSON, or None
+		self.radarConfigsUnder = {} # search dir -> [ RadarConfig file names ]
+		self.candidates        = {} # (RadarConfig files, flight) -> [ prll ]
+		self.folders           = set()
+
+	"""
+	Parse every config file under folder up front, in one pass.  Lookups for
+	files outside any added folder still work; they are parsed (once) on
+	first use.
+	"""
+	def addFolder(self, folder):
+		if folder in self.folders:
+			return
+		for file in scanFolder(folder).files("config"):
+			self.logConfig(file, config_file_name=file)
+		self.radarConfigFiles(folder)
+		self.folders.add(folder)
+
+	"""
+	Per-log *_config.log lookups
+	"""
+	def logConfig(self, log_file_name, config_file_name=None):
+		if config_file_name == None:
+			config_file_name = log_file_name.replace(".log", "_config.log")
+		if config_file_name not in self.logConfigs:
+			self.logConfigs[config_file_name] = LogConfig(config_file_name)
+		return self.logConfigs[config_file_name]
+
+	def name(self, log_file_name):
+		try:
+			return self.logConfig(log_file_name).stuff["name"]
+		except:
+			return None
+
+	"""
+	OUTPUT: the location (lat, lon, alt, ori) in units of (degree, degree,
+	        meter, degree) of the RADAR that wrote log_file_name, or None
+	"""
+	def receiver(self, log_file_name):
+		config = self.logConfig(log_file_name)
+		if config.file in self.receivers:
+			return self.receivers[config.file]
+		receiver = None
+		try:
+			stuff = config.stuff
+			lon   = stuff["receiver"]["longitude"  ]["value"]
+			lat   = stuff["receiver"]["latitude"   ]["value"]
+			alt   = stuff["receiver"]["elevation"  ]["value"]
+			ori   = stuff["receiver"]["orientation"]["value"]
+
+			# Check membership instead of equality due to peculiarities of
+			# Windows encoding.
+			assert("°" in stuff["receiver"]["longitude"  ]["unit"])
+			assert("°" in stuff["receiver"]["latitude"   ]["unit"])
+			assert("m" in stuff["receiver"]["elevation"  ]["unit"])
+			assert("°" in stuff["receiver"]["orientation"]["unit"])
+
+			receiver = (lat, lon, alt, ori)
+		except Exception as e:
+			receiver = None
+		self.receivers[config.file] = receiver
+		return receiver
+
+	def isEchoFlight(self, log_file_name):
+		ll = log_file_name.lower()
+		if "echoguard" in ll:
+			return False
+		if "echoflight" in ll:
+			return True
+		config = self.logConfig(log_file_name)
+		if config.echoguard:
+			return False
+		if config.echoflight:
+			return True
+		return None
+
+	"""
+	RadarConfig_*.json lookups
+	"""
+	def radarConfigFiles(self, searchDir):
+		if searchDir not in self.radarConfigsUnder:
+			files = scanFolder(searchDir).files("RadarConfig")
+			for file in files:
+				self.radarConfig(file)
+			self.radarConfigsUnder[searchDir] = files
+		return self.radarConfigsUnder[searchDir]
+
+	def radarConfig(self, RadarConfigFile):
+		if RadarConfigFile not in self.radarConfigs:
+			try:
+				with open(RadarConfigFile, "r") as fr:
+					self.radarConfigs[RadarConfigFile] = json.loads(fr.read())
+			except Exception as e:
+				self.radarConfigs[RadarConfigFile] = None
+		return self.radarConfigs[RadarConfigFile]
+
+	"""
+	OUTPUT: the distinct (pitch, roll, lat, lon) of every selected EchoFlight
+	        (flight=True) or EchoGuard (flight=False) radar in the file
+	"""
+	def pitchRollLatLons(self, RadarConfigFile, flight=False):
+		JSON = self.radarConfig(RadarConfigFile)
+		if JSON == None:
+			raise ValueError("Could not parse " + RadarConfigFile)
+
+		acc = lambda sp : ("/Echo" + ("Flight_" if flight else "Guard_")) in sp
+
+		radars = [
+			r for r in JSON["radars"] if
+			r["general"]["selected"] and
+			acc(r["general"]["scriptPath"])
+		]
+
+		pitch_roll_lat_lons = [
+			(
+				r["physical"]["pitchDegree"],
+				r["physical"]["rollDegree" ],
+				r["physical"]["latitude"   ],
+				r["physical"]["longitude"  ]
+			)
+			for r in radars
+		]
+
+		return list(set(pitch_roll_lat_lons))
+
+	"""
+	OUTPUT: every RadarConfig file under searchDir whose path has the date of
+	        radar_log_file in it
+	"""
+	def sameDayRadarConfigFiles(self, radar_log_file, searchDir):
+		# eg: ../flighthorizon-data/flight-tests/UAF-VAS-FAA/2021.01.22-01.29.
+		#     FlightTest1/2021.01.28.Day4/FHLogs/20210128T071018_radar.log
+		datestamp = radar_log_file.split("_radar.log")[0].split("/")[-1]
+		YMD       = datestamp.split("T")[0]
+		year      = YMD[0:4]
+		month     = YMD[4:6]
+		day       = YMD[6: ]
+		return [
+			c for c in self.radarConfigFiles(searchDir)
+			if year in c and month in c and day in c
+		]
+
+	"""
+	OUTPUT: the (pitch, roll) of the radar, in one of RadarConfigFiles (by
+	        default, every RadarConfig file under searchDir from the same day
+	        as radar_log_file), that sits within 1m of (lat, lon); else None
+	"""
+	def pitchAndRoll(self, radar_log_file, lat, lon, searchDir,
+		             RadarConfigFiles=None):
+		if RadarConfigFiles == None:
+			assert(searchDir in radar_log_file)
+			RadarConfigFiles = self.sameDayRadarConfigFiles(radar_log_file,
+				                                            searchDir)
+		flight = self.isEchoFlight(radar_log_file)
+		if flight == None:
+			return None
+
+		key = (tuple(RadarConfigFiles), flight)
+		if key not in self.candidates:
+			self.candidates[key] = list(set([
+				prll for c in RadarConfigFiles
+				for prll in self.pitchRollLatLons(c, flight)
+				if prll != None
+			]))
+
+		best_option, best_distance = None, 0
+
+		for prll in self.candidates[key]:
+
+			dist = geopy.distance.distance(
+				(prll[2], prll[3]),
+				(lat    , lon    )).m
+
+			if best_option == None or best_distance > dist:
+
+				best_option   = (prll[0], prll[1])
+				best_distance = dist
+
+		if best_distance > 1:
+			return None
+
+		print("best option was " + str(best_distance) +
+			  "m from expected location.")
+
+		return best_option
+
+# One index per process, so that every loader (and every day of a campaign)
+# shares the same parsed configs.
+CONFIG_INDEX = ConfigIndex()
+
+def getConfigIndex():
+	return CONFIG_INDEX
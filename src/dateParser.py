@@ -3,7 +3,11 @@ file    : dateParser.py
 author  : Max von Hippel
 authored: 18 August 2021
 """
-from datetime import datetime
+from datetime import datetime, timezone
+
+import warnings
+import dateutil.parser
+import numpy as np
 
 def parseDate(dateStr):
 	# '2021-06-08T21:56:58.442844700Z'
@@ -11,11 +15,50 @@ def parseDate(dateStr):
 	year, month, day = YMD.split("-")
 	year, month, day = int(year), int(month), int(day)
 	hour, minute, second = (HMS.split("Z")[0]).split(":")
-	hour, minute, second = int(hour), int(minute), int(second.split(".")[0])
+	second, _, fraction  = second.partition(".")
+	hour, minute, second = int(hour), int(minute), int(second)
+	# datetime only resolves microseconds; use parseDates to keep nanoseconds.
+	microsecond = int((fraction + "000000")[:6])
 	return datetime(
 		year=year,
 		month=month,
 		day=day,
 		hour=hour,
 		minute=minute,
-		second=second)
\ No newline at end of file
+		second=second,
+		microsecond=microsecond)
+
+def _numpyDates(dateStrs):
+	with warnings.catch_warnings():
+		warnings.simplefilter("error")
+		return np.array(dateStrs, dtype="datetime64[ns]")
+
+"""
+INPUT : dateStr - a single timestamp string in any format dateutil understands
+OUTPUT: the timestamp as a numpy datetime64[ns] (UTC, if a zone was given)
+"""
+def parseDate64(dateStr):
+	try:
+		return _numpyDates(dateStr[:-1] if dateStr.endswith("Z") else dateStr)[()]
+	except (ValueError, Warning):
+		stamp = dateutil.parser.isoparse(dateStr)
+		if stamp.tzinfo is not None:
+			stamp = stamp.astimezone(timezone.utc).replace(tzinfo=None)
+		return np.datetime64(stamp, "ns")
+
+"""
+INPUT : dateStrs - a sequence of ISO-8601 timestamp strings, such as the
+                   "timeStamp" column of a log ('2021-06-08T21:56:58.442844700Z')
+OUTPUT: a datetime64[ns] array of the same length, at full (nanosecond) 
+        precision.  The common case is parsed by numpy in a single pass; if
+        any string is in a format numpy rejects (or only accepts with a
+        warning, as for explicit UTC offsets), every string is parsed with
+        parseDate64 instead.
+"""
+def parseDates(dateStrs):
+	stripped = [s[:-1] if s.endswith("Z") else s for s in dateStrs]
+	try:
+		return _numpyDates(stripped)
+	except (ValueError, Warning):
+		return np.array([parseDate64(s) for s in dateStrs], 
+			            dtype="datetime64[ns]")
@@ -0,0 +1,107 @@
+"""
+file    : folderScan.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : Walk a data folder once, classify every file the loaders care about,
+          and remember each file's size and mtime for cache validation.
+"""
+import os
+
+from collections import namedtuple
+
+# mtime is in nanoseconds, as os.stat's st_mtime_ns
+ScannedFile = namedtuple("ScannedFile", ["path", "size", "mtime"])
+
+"""
+INPUT : name - a file's base name
+OUTPUT: the kinds of log it is, matching the glob patterns the loaders used to
+        use (eg "radar" is "*radar.log", "config" is "*_config.log").  A file
+        can be more than one kind: every "radar_config" is also a "config".
+"""
+def classify(name):
+	kinds = []
+	if name.endswith("_config.log"):
+		kinds.append("config")
+		if name.endswith("radar_config.log"):
+			kinds.append("radar_config")
+	elif name.endswith("radar.log"):
+		kinds.append("radar")
+	elif name.endswith("adsb.log"):
+		kinds.append("adsb")
+	elif name.endswith("mavlink.log"):
+		kinds.append("mavlink")
+	elif name.endswith(".nmea"):
+		kinds.append("nmea")
+	elif name.endswith(".gpx"):
+		kinds.append("gpx")
+	elif name.endswith(".vlog"):
+		kinds.append("vlog")
+	if "RadarConfig" in name and name.endswith(".json"):
+		kinds.append("RadarConfig")
+	return kinds
+
+class FolderScan(object):
+
+	def __init__(self, folder):
+		self.folder = folder
+		self.byKind = {}
+		self._walk(folder)
+		for kind in self.byKind:
+			self.byKind[kind].sort(key=lambda f : f.path)
+
+	# Like glob's "**", skip hidden files and directories.
+	def _walk(self, directory):
+		try:
+			entries = list(os.scandir(directory))
+		except OSError:
+			return
+		for entry in entries:
+			if entry.name.startswith("."):
+				continue
+			try:
+				if entry.is_dir():
+					self._walk(entry.path)
+					continue
+				kinds = classify(entry.name)
+				if len(kinds) == 0:
+					continue
+				st = entry.stat()
+			except OSError:
+				continue
+			scanned = ScannedFile(entry.path, st.st_size, st.st_mtime_ns)
+			for kind in kinds:
+				self.byKind.setdefault(kind, []).append(scanned)
+
+	"""
+	OUTPUT: the ScannedFiles of the given kind, sorted by path
+	"""
+	def entries(self, kind):
+		return list(self.byKind.get(kind, []))
+
+	"""
+	OUTPUT: the file names of the given kind, sorted
+	"""
+	def files(self, kind):
+		return [f.path for f in self.byKind.get(kind, [])]
+
+SCANS = {}
+
+"""
+INPUT : folder - the folder to scan
+OUTPUT: the FolderScan for folder.  Scans are shared by every loader in the
+        process, so a folder is walked once no matter how many loaders read it.
+"""
+def scanFolder(folder):
+	if folder not in SCANS:
+		SCANS[folder] = FolderScan(folder)
+	return SCANS[folder]
+
+"""
+Drop every remembered scan, so that the next scanFolder of any folder walks it
+(and stats its files) again.  A process that runs more than one analysis, like
+a campaign worker, calls this before each one: the sizes and mtimes a scan
+records stand in for os.stat when checking the parse cache, so a scan must not
+outlive the analysis it was made for.
+"""
+def forgetScans():
+	SCANS.clear()
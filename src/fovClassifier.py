@@ -0,0 +1,175 @@
+"""
+file    : fovClassifier.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : Batch version of radarData.is_point_in_fov.  Everything that only
+          depends on the radar (its ENU position, orientation, boresight and
+          roll correction) is worked out once; a whole array of truth
+          positions is then classified in one vectorized pass.
+"""
+import numpy   as np
+import pymap3d
+
+from scipy.spatial.transform import Rotation
+from src.FoV                 import FoVTest
+
+class FoVClassifier(object):
+
+	"""
+	fov, physical    - as returned by get_radar_fov / get_radar_physical
+	useRadarAsCenter - as for is_point_in_fov; otherwise ENU coordinates are
+	                   centered on (centerLat, centerLon, centerAlt)
+	"""
+	def __init__(self,
+		         fov,
+		         physical,
+		         useRadarAsCenter=True,
+		         centerLat=0,
+		         centerLon=0,
+		         centerAlt=0):
+
+		if useRadarAsCenter:
+			centerLat = physical.lat
+			centerLon = physical.lon
+			centerAlt = physical.alt
+
+		self.fov      = fov
+		self.physical = physical
+		self.center   = (centerLat, centerLon, centerAlt)
+
+		e, n, u = pymap3d.geodetic2enu(physical.lat,
+			                           physical.lon,
+			                           physical.alt,
+			                           centerLat,
+			                           centerLon,
+			                           centerAlt,
+			                           deg=True)
+
+		self.radar_position = np.array([e, n, u])
+
+		radar_orientation = Rotation.from_euler('ZXY',
+			                                    [-physical.heading,
+			                                      physical.pitch,
+			                                      physical.roll
+			                                    ],
+			                                    degrees=True)
+
+		# The boresight (v2 in is_point_in_fov), and the rotation about it
+		# that undoes the radar's roll.
+		self.boresight = radar_orientation.apply(np.array([0, fov.range, 0]))
+
+		self.boresight_norm = self.boresight / np.linalg.norm(self.boresight)
+
+		self.roll_rotation = Rotation.from_rotvec(
+			self.boresight_norm * np.radians(-physical.roll))
+
+	"""
+	INPUT : lats, lons, alts - truth positions (degree, degree, meter)
+	        calculate_Az_El_when_out_of_range - as for is_point_in_fov
+	OUTPUT: a FoVTest whose attributes are arrays with one entry per position:
+	        range, relative_heading, relative_elevation, is_in_range,
+	        is_in_heading, is_in_elevation and is_in_fov.  Where the angles
+	        are not calculated they are NaN and the is_in_* flags are False.
+	"""
+	def classify(self, lats, lons, alts, calculate_Az_El_when_out_of_range=True):
+
+		lats = np.asarray(lats, dtype=np.float64)
+		lons = np.asarray(lons, dtype=np.float64)
+		alts = np.asarray(alts, dtype=np.float64)
+
+		e, n, u = pymap3d.geodetic2enu(lats,
+			                           lons,
+			                           alts,
+			                           self.center[0],
+			                           self.center[1],
+			                           self.center[2],
+			                           deg=True)
+
+		v1 = np.column_stack((np.ravel(e), np.ravel(n), np.ravel(u))) \
+		   - self.radar_position
+
+		result = FoVTest()
+
+		result.range       = np.linalg.norm(v1, axis=1)
+		result.is_in_range = result.range < self.fov.range
+
+		calculate = np.full(len(v1), calculate_Az_El_when_out_of_range) \
+		          | result.is_in_range
+
+		result.relative_heading   = np.full(len(v1), np.nan)
+		result.relative_elevation = np.full(len(v1), np.nan)
+
+		if calculate.any():
+
+			v1_rot = self.roll_rotation.apply(v1[calculate])
+			if v1_rot.ndim == 1:
+				v1_rot = v1_rot[np.newaxis, :]
+
+			norm_v1_rot = v1_rot / np.linalg.norm(v1_rot, axis=1)[:, np.newaxis]
+			norm_v2     = self.boresight_norm
+
+			# Angle between the two, in the horizontal plane
+			v1_rot_xy = np.column_stack((norm_v1_rot[:, 0],
+				                         norm_v1_rot[:, 1],
+				                         np.zeros(len(norm_v1_rot))))
+			v2_rot_xy = np.array([norm_v2[0], norm_v2[1], 0])
+
+			x1 = np.linalg.norm(np.cross(v1_rot_xy, v2_rot_xy), axis=1)
+			y1 = v1_rot_xy @ v2_rot_xy
+
+			result.relative_heading  [calculate] \
+				= np.degrees(np.arctan2(x1, y1))
+			result.relative_elevation[calculate] \
+				= np.degrees(np.arcsin(norm_v1_rot[:, 2] - norm_v2[2]))
+
+		# NaN compares False, so uncalculated angles are never "in".
+		result.is_in_heading   = (result.relative_heading   > self.fov.AzMin) \
+		                       & (result.relative_heading   < self.fov.AzMax)
+		result.is_in_elevation = (result.relative_elevation > self.fov.ElMin) \
+		                       & (result.relative_elevation < self.fov.ElMax)
+		result.is_in_fov       = result.is_in_range   \
+		                       & result.is_in_heading \
+		                       & result.is_in_elevation
+
+		return result
+
+	"""
+	INPUT : points - truth Points (with latitude, longitude and altitude)
+	OUTPUT: one FoVTest per truth point, with the same attributes (and the same
+	        types) is_point_in_fov would have given it.  In particular is_in_fov
+	        is a plain False only when the point is out of range, and a numpy
+	        bool otherwise; TimeToDetect.populate_encounter_list tells the two
+	        apart.
+	"""
+	def classifyPoints(self, points, calculate_Az_El_when_out_of_range=True):
+
+		result = self.classify([p.latitude  for p in points],
+			                   [p.longitude for p in points],
+			                   [p.altitude  for p in points],
+			                   calculate_Az_El_when_out_of_range)
+
+		answers = []
+
+		for i in range(len(points)):
+
+			answer = FoVTest()
+			answer.range = result.range[i]
+
+			if answer.range < self.fov.range:
+				answer.is_in_range = True
+			else:
+				answer.is_in_range = False
+				answer.is_in_fov   = False
+
+			if answer.is_in_range or calculate_Az_El_when_out_of_range:
+				answer.relative_heading   = result.relative_heading  [i]
+				answer.relative_elevation = result.relative_elevation[i]
+				answer.is_in_heading      = result.is_in_heading     [i]
+				answer.is_in_elevation    = result.is_in_elevation   [i]
+				answer.is_in_fov          = (answer.is_in_range   and \
+				                             answer.is_in_heading and \
+				                             answer.is_in_elevation)
+
+			answers.append(answer)
+
+		return answers
@@ -0,0 +1,51 @@
+"""
+file    : ingest.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : Run a per-file log parser over many files, either in this process or
+          across a pool of worker processes.
+"""
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from src.folderScan     import ScannedFile
+
+"""
+INPUT : workers - the requested number of worker processes; 0 or None means
+                  one per CPU core
+OUTPUT: the number of worker processes to actually use
+"""
+def resolveWorkers(workers):
+	if workers == None or workers <= 0:
+		return os.cpu_count() or 1
+	return workers
+
+def _parseOne(task):
+	(parser, file, cache) = task
+	scanned = file if isinstance(file, ScannedFile) else None
+	if scanned != None:
+		file = scanned.path
+	if cache == None:
+		return parser(file)
+	return cache.parse(parser, file, scanned)
+
+"""
+INPUT : parser  - a module-level function taking one file name (it has to be
+                  picklable, so no lambdas or closures)
+        files   - the file names to parse, or ScannedFiles (see 
+                  src/folderScan.py), whose recorded size and mtime then 
+                  stand in for a fresh os.stat when checking the cache
+        workers - how many processes to parse with (1 parses in this process)
+        cache   - a ParseCache (see src/parseCache.py), or None to always parse
+OUTPUT: [ parser(file) for file in files ], in the same order as files no
+        matter which worker finishes first.  Parsers return RadarTable or
+        TruthTable objects, so what travels back from a worker is a handful of
+        NumPy arrays rather than one pickled object per point.
+"""
+def parseFiles(parser, files, workers=1, cache=None):
+	tasks   = [(parser, file, cache) for file in files]
+	workers = min(resolveWorkers(workers), len(tasks))
+	if workers <= 1:
+		return [_parseOne(task) for task in tasks]
+	with ProcessPoolExecutor(max_workers=workers) as pool:
+		return list(pool.map(_parseOne, tasks))
@@ -0,0 +1,107 @@
+"""
+file    : jsonStream.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : Incremental reader for log files laid out as one top-level JSON
+          array of objects (the *_radar.log, *_adsb.log and *_mavlink.log
+          formats), so that a whole log never has to sit in memory at once.
+"""
+import json
+import re
+
+_DECODER    = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+def _malformed(file_name, what):
+	return ValueError(file_name + " is not a well-formed JSON array ("
+	                  + what + ")")
+
+"""
+INPUT : file_name  - the name of a file containing a top-level JSON array
+        chunk_size - how many characters to read from the file at a time
+OUTPUT: a generator over the elements of the array, in file order.  Only the
+        current chunk (plus whatever element straddles it) is held in memory.
+        Raises ValueError wherever json.load would reject the file: not an
+        array, a missing or trailing comma, a bad element, trailing text.
+"""
+def iterJSONArray(file_name, chunk_size=1 << 16):
+	with open(file_name, "r") as fr:
+
+		buf       = ""
+		pos       = 0
+		eof       = False
+		read_size = chunk_size
+
+		# Drop what has been consumed and read on.  The read size doubles
+		# (until the next element is yielded) so that a single huge element
+		# is not re-decoded once per chunk.
+		def readMore(buf, pos):
+			nonlocal eof, read_size
+			more       = fr.read(read_size)
+			eof        = len(more) < read_size
+			read_size *= 2
+			return buf[pos:] + more, 0
+
+		# Move pos to the next non-whitespace character, reading on until
+		# there is one (or the file ends, in which case pos == len(buf)).
+		def nextChar(buf, pos):
+			pos = _WHITESPACE.match(buf, pos).end()
+			while pos == len(buf) and not eof:
+				buf, pos = readMore(buf, pos)
+				pos      = _WHITESPACE.match(buf, pos).end()
+			return buf, pos
+
+		buf, pos = nextChar(buf, pos)
+
+		if buf[pos:pos + 1] != "[":
+			raise _malformed(file_name, "no opening [")
+
+		buf, pos = nextChar(buf, pos + 1)
+
+		if buf[pos:pos + 1] == "]":
+			buf, pos = nextChar(buf, pos + 1)
+			if pos < len(buf):
+				raise _malformed(file_name, "text after the closing ]")
+			return
+
+		while True:
+
+			# pos is at the start of an element.
+			if pos == len(buf):
+				raise _malformed(file_name, "no closing ]")
+
+			if buf[pos] in ",]":
+				raise _malformed(file_name, "missing element")
+
+			try:
+				entry, end = _DECODER.raw_decode(buf, pos)
+			except json.JSONDecodeError:
+				if eof:
+					raise
+				buf, pos = readMore(buf, pos)
+				continue
+
+			# The element only counts once the , or ] after it is in the
+			# buffer: until then it might be a truncated number (1. or 1e)
+			# or be followed by something other than a separator.
+			after = _WHITESPACE.match(buf, end).end()
+
+			if after == len(buf) or buf[after] not in ",]":
+				if not eof:
+					buf, pos = readMore(buf, pos)
+					continue
+				if after == len(buf):
+					raise _malformed(file_name, "no closing ]")
+				raise _malformed(file_name, "missing comma")
+
+			yield entry
+
+			read_size = chunk_size
+
+			if buf[after] == "]":
+				buf, pos = nextChar(buf, after + 1)
+				if pos < len(buf):
+					raise _malformed(file_name, "text after the closing ]")
+				return
+
+			buf, pos = nextChar(buf, after + 1)
@@ -7,6 +7,8 @@ purpose : Mathematical utilities used in other scripts.
 import math
 import json
 
+import numpy as np
+
 from datetime import datetime
 
 
@@ -37,7 +39,7 @@ def PAC(time,
 		   None == truth_point.longitude or \
 		   None == truth_point.altitude:
 
-		   print(json.dumps(truth_point.__dict__))
+		   print(json.dumps(truth_point.asDict()))
 
 		   return False
 
@@ -128,4 +130,72 @@ def distanceKM(lat1, lon1, lat2, lon2):
 	
 	distance = R * c
 
-	return distance
\ No newline at end of file
+	return distance
+
+"""
+Array versions of targetBearing, targetPosition and distanceKM.  They take 
+NumPy arrays (or anything broadcastable to them) and agree with the scalar
+functions above to within floating-point rounding, so that a whole log can be
+geolocated in one call instead of one Python call per point.
+"""
+def targetBearingArray(_azimuth, _radar_orientation):
+	_azimuth = np.asarray(_azimuth, dtype=np.float64)
+	return np.where(_azimuth <= 0, -1 * _azimuth, 360 - _azimuth) \
+	       + _radar_orientation
+
+def targetPositionArray(_range, _azimuth, _elevation, receiver):
+	(lat1, lon1, alt1, radar_orientation) = receiver
+
+	_range     = np.asarray(_range,     dtype=np.float64)
+	_elevation = np.asarray(_elevation, dtype=np.float64)
+	
+	horizontal_distance = _range * np.cos(np.radians(_elevation)) # METERs
+	vertical_distance   = _range * np.sin(np.radians(_elevation)) # METERs
+	bearing = targetBearingArray(_azimuth, radar_orientation) # DEGREE_ANGLE
+
+	R = 6.371009 * (10 ** 6) + alt1
+
+	bearing_radians = np.radians(bearing)
+
+	lat1 = math.radians(lat1)
+	lon1 = math.radians(lon1)
+
+	lat2 = np.arcsin(
+		math.sin(lat1) * np.cos(horizontal_distance / R) +
+		math.cos(lat1) * np.sin(horizontal_distance / R) * 
+			np.cos(bearing_radians))
+
+	lon2 = lon1 + np.arctan2(
+				np.sin(bearing_radians) * np.sin(horizontal_distance / R) 
+					* math.cos(lat1),
+				np.cos(horizontal_distance / R) - math.sin(lat1) 
+					* np.sin(lat2))
+
+	lat2 = np.degrees(lat2)
+	lon2 = np.degrees(lon2)
+	alt2 = alt1 + vertical_distance
+
+	return (lat2, lon2, alt2)
+
+def distanceKMArray(lat1, lon1, lat2, lon2):
+	R = 6373.0 # radius of the Earth in km
+	rlat1 = np.radians(lat1)
+	rlon1 = np.radians(lon1)
+	rlat2 = np.radians(lat2)
+	rlon2 = np.radians(lon2)
+	dlon = rlon2 - rlon1
+	dlat = rlat2 - rlat1
+	
+	# Haversine formula
+	a = np.sin(dlat / 2) ** 2 \
+	  + np.cos(rlat1) * np.cos(rlat2) * np.sin(dlon / 2) ** 2
+
+	c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+	
+	distance = R * c
+
+	# Same short-cut as distanceKM for coincident points.
+	same = (np.asarray(lat1) == np.asarray(lat2)) & \
+	       (np.asarray(lon1) == np.asarray(lon2))
+
+	return np.where(same, 0.0, distance)
@@ -0,0 +1,156 @@
+"""
+file    : nmeaDecoder.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : Single-pass decoder for ground-station NMEA logs.  The "activated"
+          date header and the GGA / RMC sentences are pulled out with
+          precompiled patterns and checked against their checksums; pynmea2
+          is only consulted for other sentence types that carry a position.
+"""
+from functools import reduce
+
+import re
+import numpy as np
+import pynmea2
+
+_ACTIVATED = re.compile(r'"activated"\s*:\s*"(\d{4})-(\d{2})-(\d{2})')
+
+# $<talker><type>,<fields>[*<checksum>]
+_SENTENCE  = re.compile(r"\$(([A-Z0-9]{2})([A-Z]{3}),([^*\r\n]*))"
+	                    r"(?:\*([0-9A-Fa-f]{2}))?")
+
+NS_PER_DAY = 24 * 60 * 60 * 10 ** 9
+
+"""
+INPUT : body     - everything between the "$" and the "*" of a sentence
+        checksum - the two hex digits after the "*", or None
+OUTPUT: True unless a checksum is given and does not match
+"""
+def checksumOK(body, checksum):
+	if checksum == None:
+		return True
+	return reduce(lambda acc, c : acc ^ ord(c), body, 0) == int(checksum, 16)
+
+"""
+INPUT : hhmmss - a UTC time field such as "071018.25"
+OUTPUT: nanoseconds since midnight
+"""
+def timeOfDayNS(hhmmss):
+	whole, _, fraction = hhmmss.partition(".")
+	seconds = int(whole[0:2]) * 3600 + int(whole[2:4]) * 60 + int(whole[4:6])
+	return seconds * 10 ** 9 + int((fraction + "000000000")[:9])
+
+"""
+INPUT : dm   - a (d)ddmm.mmmm latitude or longitude field
+        hemi - "N", "S", "E" or "W"
+OUTPUT: signed decimal degrees (computed the way pynmea2 does)
+"""
+def signedDegrees(dm, hemi):
+	i = dm.find(".")
+	if i == -1:
+		i = len(dm)
+	sd = float(dm[:i - 2]) + float(dm[i - 2:]) / 60
+	return -sd if hemi in ("S", "W") else sd
+
+# Sentence types pynmea2 knows that carry a timestamp and a 3D position.
+_FALLBACK = {}
+
+def _hasFix(sentence_type):
+	if sentence_type not in _FALLBACK:
+		cls    = pynmea2.TalkerSentence.sentence_types.get(sentence_type)
+		fields = set() if cls == None else set(f[1] for f in cls.fields)
+		_FALLBACK[sentence_type] = {"timestamp", "lat", "altitude"} <= fields
+	return _FALLBACK[sentence_type]
+
+"""
+INPUT : nmea_file_name - a ground-station NMEA log
+        date           - the UTC date of the first fix, or None to take it
+                         from the "activated" header (or the first RMC)
+OUTPUT: (stamps, latitudes, longitudes, altitudes) as arrays, one entry per
+        GGA (or fallback) fix.  Stamps are datetime64[ns]; missing altitudes
+        are NaN.  RMC dates, and the time of day going backwards by more than
+        twelve hours, move the date forward across midnight.  Fixes seen
+        before any date is known are dropped.
+"""
+def decodeNMEA(nmea_file_name, date=None):
+
+	day   = None if date == None else np.datetime64(date, "D")
+	last  = None
+	days, times, lats, lons, alts = [], [], [], [], []
+
+	with open(nmea_file_name, "r", encoding='utf-8', errors="replace") as fr:
+		for line in fr:
+
+			m = _SENTENCE.search(line)
+
+			if m == None:
+				if day == None:
+					h = _ACTIVATED.search(line)
+					if h != None:
+						day = np.datetime64("-".join(h.groups()), "D")
+				continue
+
+			body, talker, kind, fields, checksum = m.groups()
+
+			if not checksumOK(body, checksum):
+				continue
+
+			fields = fields.split(",")
+
+			try:
+				if kind == "GGA":
+					if fields[1] == "" or fields[3] == "":
+						continue
+					t   = timeOfDayNS(fields[0])
+					lat = signedDegrees(fields[1], fields[2])
+					lon = signedDegrees(fields[3], fields[4])
+					alt = float(fields[8]) if fields[8] != "" else np.nan
+
+				elif kind == "RMC":
+					ddmmyy = fields[8]
+					if len(ddmmyy) == 6:
+						day  = np.datetime64("20" + ddmmyy[4:6] + "-" +
+							                 ddmmyy[2:4] + "-" +
+							                 ddmmyy[0:2], "D")
+						last = timeOfDayNS(fields[0])
+					continue
+
+				elif _hasFix(kind):
+					msg = pynmea2.parse(line[m.start():m.end()])
+					ts  = msg.timestamp
+					t   = ((ts.hour * 60 + ts.minute) * 60 + ts.second) \
+					      * 10 ** 9 + ts.microsecond * 1000
+					lat = msg.latitude
+					lon = msg.longitude
+					# Not every sentence type has pynmea2 convert the
+					# altitude; some leave the raw (possibly empty) field.
+					alt = np.nan if msg.altitude in (None, "") \
+					      else float(msg.altitude)
+
+				else:
+					continue
+
+			except Exception as e:
+				# malformed sentence; skip it
+				continue
+
+			if day == None:
+				continue
+
+			if last != None and t < last - NS_PER_DAY // 2:
+				day = day + np.timedelta64(1, "D")
+			last = t
+
+			days .append(day)
+			times.append(t  )
+			lats .append(lat)
+			lons .append(lon)
+			alts .append(alt)
+
+	stamps = np.asarray(days, dtype="datetime64[D]").astype("datetime64[ns]") \
+	       + np.asarray(times, dtype=np.int64).astype("timedelta64[ns]")
+
+	return stamps,                             \
+	       np.asarray(lats, dtype=np.float64), \
+	       np.asarray(lons, dtype=np.float64), \
+	       np.asarray(alts, dtype=np.float64)
@@ -0,0 +1,289 @@
+"""
+file    : pacIndex.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : Answer mathUtils.PAC for many radar points against one set of truth
+          points without walking the whole truth set per radar point.
+
+PAC walks the truth points in order and
+  - returns False (after printing the point) at the first truth point with a
+    missing stamp, latitude, longitude or altitude,
+  - skips truth points inside the time window around the radar point (the
+    window is excluded, not required),
+  - returns True at the first remaining truth point within the horizontal and
+    vertical tolerances.
+So only the truth points before the first incomplete one matter, and the
+answer is True exactly when one of them passes all three tests.  Since the
+time test keeps everything *outside* a window, time is a poor filter; the
+index prunes on horizontal position instead, with a KD-tree over the truth
+points on the same sphere distanceKM uses.  Candidates from the tree are then
+checked with the very same time, altitude and distanceKM arithmetic as PAC.
+"""
+import json
+import math
+import numpy as np
+
+from scipy.spatial  import cKDTree
+
+from src.mathUtils  import PAC, distanceKM, distanceKMArray
+from src.trackTable import TrackTable, TruthTable, toDatetimes
+
+# distanceKM's radius of the Earth, in meters
+EARTH_RADIUS_M = 6373.0 * 1000
+
+def _unitSphere(lats, lons):
+	lats = np.radians(np.asarray(lats, dtype=np.float64))
+	lons = np.radians(np.asarray(lons, dtype=np.float64))
+	return EARTH_RADIUS_M * np.column_stack((np.cos(lats) * np.cos(lons),
+		                                     np.cos(lats) * np.sin(lons),
+		                                     np.sin(lats)))
+
+"""
+OUTPUT: a chord length (through the sphere) no shorter than the chord of a
+        great-circle arc of `meters`, with some slack for rounding
+"""
+def _chordRadius(meters):
+	half_angle = min(max(meters, 0) / (2 * EARTH_RADIUS_M), math.pi / 2)
+	return 2 * EARTH_RADIUS_M * math.sin(half_angle) * (1 + 1e-9) + 1e-3
+
+class PACIndex(object):
+
+	"""
+	truth - a TruthTable, or a list of Points (in the order PAC would see them)
+	"""
+	def __init__(self, truth):
+
+		if isinstance(truth, TrackTable):
+			self.table   = truth
+			self._points = None
+		else:
+			self._points = list(truth)
+			self.table   = TruthTable.fromPoints(self._points)
+
+		# Points carry microsecond datetimes, so compare at that precision.
+		stamp    = self.table.stamp.astype("datetime64[us]")
+		complete = ~np.isnat(stamp)                 \
+		         & ~np.isnan(self.table.latitude )  \
+		         & ~np.isnan(self.table.longitude)  \
+		         & ~np.isnan(self.table.altitude )
+
+		incomplete     = np.flatnonzero(~complete)
+		self.firstNone = int(incomplete[0]) if len(incomplete) > 0 else None
+
+		# Only the truth points before the first incomplete one are reachable.
+		n = len(self.table) if self.firstNone == None else self.firstNone
+
+		self.stamp     = stamp[:n].astype(np.int64)
+		self.latitude  = self.table.latitude [:n]
+		self.longitude = self.table.longitude[:n]
+		self.altitude  = self.table.altitude [:n]
+		self.tree      = cKDTree(_unitSphere(self.latitude, self.longitude)) \
+		                 if n > 0 else None
+
+	"""
+	OUTPUT: the truth points as Points, as PAC would be given them
+	"""
+	def points(self):
+		if self._points == None:
+			self._points = list(self.table)
+		return self._points
+
+	def _point(self, i):
+		if self._points != None:
+			return self._points[i]
+		return self.table.row(i)
+
+	"""
+	Same arguments and result as mathUtils.PAC, for a single radar point.
+	"""
+	def query(self,
+		      time,
+		      lat,
+		      lon,
+		      alt,
+		      allowed_hoz_deviation=10,
+		      allowed_vertical_deviation=10,
+		      allowed_time_deviation=60,
+		      only_test_after_truth=True):
+
+		return bool(self.test(
+			np.asarray([time], dtype="datetime64[us]"),
+			[np.nan if lat == None else lat],
+			[np.nan if lon == None else lon],
+			[np.nan if alt == None else alt],
+			allowed_hoz_deviation,
+			allowed_vertical_deviation,
+			allowed_time_deviation,
+			only_test_after_truth)[0])
+
+	"""
+	INPUT : stamps, lats, lons, alts - one entry per radar point
+	        (the remaining arguments are as for mathUtils.PAC)
+	OUTPUT: a boolean array, PAC's answer for each radar point
+	"""
+	def test(self,
+		     stamps,
+		     lats,
+		     lons,
+		     alts,
+		     allowed_hoz_deviation=10,
+		     allowed_vertical_deviation=10,
+		     allowed_time_deviation=60,
+		     only_test_after_truth=True):
+
+		stamps = np.asarray(stamps, dtype="datetime64[us]")
+		lats   = np.asarray(lats,   dtype=np.float64)
+		lons   = np.asarray(lons,   dtype=np.float64)
+		alts   = np.asarray(alts,   dtype=np.float64)
+		result = np.zeros(len(stamps), dtype=bool)
+
+		odd    = np.isnat(stamps) | np.isnan(lats) \
+		       | np.isnan(lons)   | np.isnan(alts)
+		normal = np.flatnonzero(~odd)
+
+		if self.tree != None and len(normal) > 0:
+
+			candidates = self.tree.query_ball_point(
+				_unitSphere(lats[normal], lons[normal]),
+				_chordRadius(allowed_hoz_deviation))
+
+			times = stamps[normal].astype(np.int64)
+
+			for i, t, c in zip(normal.tolist(), times.tolist(), candidates):
+
+				if len(c) == 0:
+					continue
+
+				c = np.asarray(c, dtype=np.intp)
+
+				# (time - truth).total_seconds(), as PAC computes it
+				seconds = (t - self.stamp[c]) / 1e6
+
+				if only_test_after_truth:
+					keep = ~((seconds >= 0) & (seconds < allowed_time_deviation))
+				else:
+					keep = ~(np.abs(-seconds) <= allowed_time_deviation)
+
+				keep &= ~(np.abs(alts[i] - self.altitude[c])
+					      > allowed_vertical_deviation)
+
+				for j in c[keep].tolist():
+					meters = distanceKM(float(self.latitude [j]),
+						                float(self.longitude[j]),
+						                float(lats[i]),
+						                float(lons[i])) * 1000
+					if not meters > allowed_hoz_deviation:
+						result[i] = True
+						break
+
+		# Radar points with missing values get PAC itself, failures and all.
+		# Any other radar point with no match reaches the first incomplete
+		# truth point, where PAC prints it and gives up.  Both happen in
+		# radar order, as they would calling PAC point by point.
+		for i in range(len(stamps)):
+			if odd[i]:
+				result[i] = PAC(
+					None if np.isnat(stamps[i]) else toDatetimes(stamps[i]),
+					None if lats[i] != lats[i] else float(lats[i]),
+					None if lons[i] != lons[i] else float(lons[i]),
+					None if alts[i] != alts[i] else float(alts[i]),
+					self.points(),
+					allowed_hoz_deviation=allowed_hoz_deviation,
+					allowed_vertical_deviation=allowed_vertical_deviation,
+					allowed_time_deviation=allowed_time_deviation,
+					only_test_after_truth=only_test_after_truth)
+			elif not result[i] and self.firstNone != None:
+				print(json.dumps(self._point(self.firstNone).asDict()))
+
+		return result
+
+"""
+INPUT : radar_table - a RadarTable (e.g. one block)
+        truth_table - a TruthTable, or None if index is given
+        hoz, vert   - allowed horizontal and vertical deviation, in meters
+        dt          - allowed time deviation, in seconds
+        only_after  - PAC's only_test_after_truth
+        index       - an already-built PACIndex over truth_table, to reuse
+        chunk       - how many radar rows to pair up with truth at a time
+OUTPUT: (mask, match), where mask[i] is PAC's answer for radar row i and
+        match[i] is the truth row PAC would stop at when it says True (the
+        lowest-numbered truth row that passes), or -1.
+
+Unlike PAC this never prints; radar rows with missing values, and truth rows
+from the first incomplete one on, simply never match.  Candidate pairs come
+from the index's KD-tree, one chunk of radar rows at a time, so memory is
+bounded by the pairs of a single chunk.  The time, altitude and distance
+tests run on whole arrays of pairs; distances within a hair of the limit are
+re-checked with the scalar distanceKM so the boundary falls where PAC puts it.
+"""
+def pac_mask(radar_table,
+	         truth_table=None,
+	         hoz=10,
+	         vert=10,
+	         dt=60,
+	         only_after=True,
+	         index=None,
+	         chunk=4096):
+
+	if index == None:
+		index = PACIndex(truth_table)
+
+	n     = len(radar_table)
+	match = np.full(n, -1, dtype=np.int64)
+
+	if index.tree == None or n == 0:
+		return match >= 0, match
+
+	stamps = radar_table.stamp.astype("datetime64[us]")
+	usable = ~np.isnat(stamps)                   \
+	       & ~np.isnan(radar_table.latitude )    \
+	       & ~np.isnan(radar_table.longitude)    \
+	       & ~np.isnan(radar_table.altitude )
+	rows   = np.flatnonzero(usable)
+	times  = stamps.astype(np.int64)
+	radius = _chordRadius(hoz)
+	slack  = 1e-6 * max(1.0, hoz)
+
+	for start in range(0, len(rows), chunk):
+
+		r    = rows[start:start + chunk]
+		lats = radar_table.latitude [r]
+		lons = radar_table.longitude[r]
+
+		candidates = index.tree.query_ball_point(_unitSphere(lats, lons),
+			                                     radius)
+		lengths    = np.fromiter((len(c) for c in candidates),
+			                     dtype=np.int64, count=len(candidates))
+		if lengths.sum() == 0:
+			continue
+
+		i = np.repeat(np.arange(len(r)), lengths)
+		j = np.concatenate([c for c in candidates if len(c) > 0]) \
+		      .astype(np.intp)
+
+		# (time - truth).total_seconds(), as PAC computes it
+		seconds = (times[r][i] - index.stamp[j]) / 1e6
+		if only_after:
+			keep = ~((seconds >= 0) & (seconds < dt))
+		else:
+			keep = ~(np.abs(-seconds) <= dt)
+		keep &= ~(np.abs(radar_table.altitude[r][i] - index.altitude[j])
+			      > vert)
+		i, j = i[keep], j[keep]
+
+		meters = distanceKMArray(index.latitude[j], index.longitude[j],
+			                     lats[i], lons[i]) * 1000
+		passed = ~(meters > hoz)
+
+		for k in np.flatnonzero(np.abs(meters - hoz) <= slack).tolist():
+			passed[k] = not distanceKM(float(index.latitude [j[k]]),
+				                       float(index.longitude[j[k]]),
+				                       float(lats[i[k]]),
+				                       float(lons[i[k]])) * 1000 > hoz
+
+		first = np.full(len(r), np.iinfo(np.int64).max, dtype=np.int64)
+		np.minimum.at(first, i[passed], j[passed])
+		found = first != np.iinfo(np.int64).max
+		match[r[found]] = first[found]
+
+	return match >= 0, match
@@ -0,0 +1,146 @@
+"""
+file    : parseCache.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : On-disk cache of parsed (and geolocated) per-file tables, so that
+          re-running an analysis over raw logs that have not changed skips the
+          JSON decoding entirely.
+"""
+import hashlib
+import os
+import sys
+
+import numpy as np
+
+from src.trackTable import RadarTable, TruthTable
+
+# Bump this whenever the layout of a cache entry changes, or when something a
+# parser relies on outside its own module (date parsing, geolocation, ...)
+# changes what it returns, so that stale cache entries stop matching.  Edits
+# to the parser's own module are caught by moduleHash.
+PARSER_VERSION = 4
+
+DEFAULT_CACHE_DIR = ".flighthorizon-cache"
+
+TABLE_TYPES = { cls.__name__ : cls for cls in (RadarTable, TruthTable) }
+
+"""
+INPUT : file_name - a file on disk
+OUTPUT: (path, size, mtime in ns) of the file, or None if it does not exist
+"""
+def fingerprint(file_name):
+	try:
+		st = os.stat(file_name)
+	except OSError:
+		return None
+	return (os.path.abspath(file_name), st.st_size, st.st_mtime_ns)
+
+MODULE_HASHES = {}
+
+"""
+INPUT : parser - a log parser function
+OUTPUT: a hash of the source file of the module parser is defined in (None if
+        there is no such file), worked out once per module per process
+"""
+def moduleHash(parser):
+	name = parser.__module__
+	if name not in MODULE_HASHES:
+		source = getattr(sys.modules.get(name), "__file__", None)
+		try:
+			with open(source, "rb") as fr:
+				MODULE_HASHES[name] = hashlib.sha1(fr.read()).hexdigest()
+		except (OSError, TypeError):
+			MODULE_HASHES[name] = None
+	return MODULE_HASHES[name]
+
+class ParseCache(object):
+
+	"""
+	cacheDir - where to keep the .npz entries
+	rebuild  - if True, never read existing entries (but do overwrite them)
+	"""
+	def __init__(self, cacheDir=DEFAULT_CACHE_DIR, rebuild=False):
+		self.cacheDir = cacheDir
+		self.rebuild  = rebuild
+
+	"""
+	The key covers the parser (name, PARSER_VERSION and the source of its
+	module), the log itself and
+	its companion *_config.log, if any, since the RADAR location there goes
+	into the geolocated table.  Any change to any of them gives a new key.
+	"""
+	def key(self, parser, file_name, scanned=None):
+		config_file_name = file_name.replace(".log", "_config.log")
+		parts = [
+			parser.__module__ + "." + parser.__name__,
+			PARSER_VERSION,
+			moduleHash(parser),
+			fingerprint(file_name) if scanned == None else 
+				(os.path.abspath(scanned.path), scanned.size, scanned.mtime),
+			fingerprint(config_file_name) \
+				if config_file_name != file_name else None
+		]
+		return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+
+	def path(self, parser, file_name, scanned=None):
+		return os.path.join(self.cacheDir, 
+			                self.key(parser, file_name, scanned) + ".npz")
+
+	"""
+	The key is the same however file_name is spelled (relative to whatever
+	folder, or absolute), but parsers use file_name itself as the src of
+	their points.  So the spelling the entry was stored under is kept, and on
+	load those srcs are renamed to the spelling asked for now.
+	"""
+	def load(self, path, file_name):
+		with np.load(path, allow_pickle=False) as npz:
+			arrays = { name : npz[name] for name in npz.files }
+		table  = str(arrays.pop("table"))
+		stored = str(arrays.pop("fileName"))
+		if table == "None":
+			return None
+		arrays["srcNames"] = np.asarray([
+			file_name if name == stored else name
+			for name in arrays["srcNames"].tolist()
+		], dtype=str)
+		return TABLE_TYPES[table].fromArrays(arrays)
+
+	"""
+	A table with no src at all is what a parser returns when it gives up on a
+	log it cannot read (e.g. one that is still being written), so it is not
+	stored: the next run parses the log again.
+	"""
+	def store(self, path, result, file_name):
+		if result == None:
+			arrays = { "table" : np.array("None") }
+		elif type(result).__name__ in TABLE_TYPES:
+			if len(result.srcNames) == 0:
+				return
+			arrays = result.toArrays()
+			arrays["table"] = np.array(type(result).__name__)
+		else:
+			return
+		arrays["fileName"] = np.array(file_name)
+		os.makedirs(self.cacheDir, exist_ok=True)
+		# Write then rename, so that concurrent workers (or an interrupted 
+		# run) never leave a half-written entry behind.
+		tmp = path + "." + str(os.getpid()) + ".tmp.npz"
+		np.savez_compressed(tmp, **arrays)
+		os.replace(tmp, path)
+
+	"""
+	INPUT : parser    - the function that parses file_name
+	        file_name - the log to parse
+	        scanned   - file_name's ScannedFile, if the caller has one
+	OUTPUT: parser(file_name), from the cache when possible
+	"""
+	def parse(self, parser, file_name, scanned=None):
+		path = self.path(parser, file_name, scanned)
+		if not self.rebuild and os.path.isfile(path):
+			try:
+				return self.load(path, file_name)
+			except Exception as e:
+				print("Ignoring unreadable cache entry " + path)
+		result = parser(file_name)
+		self.store(path, result, file_name)
+		return result
@@ -4,11 +4,17 @@ author  : Max von Hippel
 authored: 4 July 2021
 purpose : To answer questions about the data.
 """
-import pandas            as pd
+import numpy             as np
 import matplotlib        as mpl
 import matplotlib.pyplot as plt
+from   matplotlib.figure import Figure
+from   matplotlib.backends.backend_agg import FigureCanvasAgg
+import functools
+import inspect
+import math
 import os
-from   src.mathUtils     import PAC
+from   src.pacIndex      import pac_mask
+from   src.trackTable    import toDatetimes
 
 class Question:
 
@@ -113,164 +119,229 @@ class Question:
 	"""
 	def plotXY(self, save=False):
 
-		allStamps = set([s for (s, _) in self.timestamped_X]).union(
-				    set([s for (s, _) in self.timestamped_Y])
-		)
+		(X_stamps, X_values) = _lastValuePerStamp(self.timestamped_X)
+		(Y_stamps, Y_values) = _lastValuePerStamp(self.timestamped_Y)
 
-		minStamp = min(allStamps)
-		maxStamp = max(allStamps)
+		allStamps = np.union1d(X_stamps, Y_stamps)
 
-		datestr = str(minStamp) + " to " + str(maxStamp)
-
-		allStamps = sorted(list(set([s for (s, _) in self.timestamped_X]).union(
-			set([s for (s, _) in self.timestamped_Y]))))
+		minStamp = toDatetimes(allStamps[ 0])
+		maxStamp = toDatetimes(allStamps[-1])
 
-		X_ts = pd.Series(
-			data={ k : v for (k, v) in self.timestamped_X },
-			index=allStamps).interpolate()
+		datestr = str(minStamp) + " to " + str(maxStamp)
 
-		Y_ts = pd.Series(
-			data={ k : v for (k, v) in self.timestamped_Y },
-			index=allStamps).interpolate()
+		X_ts = _interpolated(len(allStamps), 
+			                 np.searchsorted(allStamps, X_stamps),
+			                 X_values)
 
-		def colored(k):
-			matching_X = len([t for (t, _) in self.timestamped_X if t == k])
-			matching_Y = len([t for (t, _) in self.timestamped_Y if t == k])
-			if matching_X > 0:
-				if matching_Y > 0:
-					return 'green'
-				return 'blue'
-			assert(matching_Y > 0)
-			return 'red'
+		Y_ts = _interpolated(len(allStamps), 
+			                 np.searchsorted(allStamps, Y_stamps),
+			                 Y_values)
 
-		colors = pd.Series(
-			data={ k : colored(k) for k in allStamps },
-			index=allStamps)
+		# green: stamp in both series; blue: X only; red: Y only
+		in_X   = np.isin(allStamps, X_stamps)
+		in_Y   = np.isin(allStamps, Y_stamps)
+		colors = np.where(in_X & in_Y, 'green', 
+			              np.where(in_X, 'blue', 'red')).tolist()
 
 		xAx = "Unknown X" if self.X_axis_name == None else self.X_axis_name
 		yAx = "Unknown Y" if self.Y_axis_name == None else self.Y_axis_name
 
 		title  = xAx + " versus " + yAx + "\n" + datestr
 
-		# For more complex plots we should be using fig = plt.figure(), 
-		# but just adding plt.clf() is a simple solution
+		# Saved plots get a Figure of their own, drawn by the Agg canvas and
+		# never registered with pyplot, so that no global state is shared
+		# between plots (or between processes drawing them).
+		if save == True:
+			fig = Figure()
+			FigureCanvasAgg(fig)
+		else:
+			fig = plt.figure()
 
-		#fig = plt.figure()
-		#ax = fig.add_subplot(1,1,1)
+		ax = fig.add_subplot(1, 1, 1)
 
-		plt.title  (title + datestr)
-		plt.xlabel (xAx            )
-		plt.ylabel (yAx            )
+		ax.set_title  (title + datestr)
+		ax.set_xlabel (xAx            )
+		ax.set_ylabel (yAx            )
 		
-		plt.scatter(X_ts, 
-			        Y_ts, 
-			        c=colors)
+		ax.scatter(X_ts, 
+			       Y_ts, 
+			       c=colors)
 		
 		if save == True:
 			datedir = datestr.replace("/", ".")\
 			                 .replace(" ", "_")\
 			                 .replace(":", ".")
 
-			if not os.path.isdir(datedir):
-				os.mkdir(datedir)
+			os.makedirs(datedir, exist_ok=True)
 
-			plt.savefig(datedir + "/" + title.replace(" " , "_")\
+			fig.savefig(datedir + "/" + title.replace(" " , "_")\
 				                             .replace(":" , ".")\
 				                             .replace("/" , ".")\
 				                             .replace("\n", ".")\
 				                             .replace("(" , "" )\
 				                             .replace(")" , "" ) + ".png")
-			plt.clf()
 		else:
 			plt.show()
 
 
+"""
+INPUT : timestamped - [ ... (stamp, value) ... ]
+OUTPUT: (sorted distinct stamps as datetime64[us], the float value last given
+        for each), the way a dict built from the pairs would keep them
+"""
+def _lastValuePerStamp(timestamped):
+	stamps = np.asarray([s for (s, _) in timestamped], dtype="datetime64[us]")
+	values = np.asarray([v for (_, v) in timestamped], dtype=np.float64)
+	(distinct, last) = np.unique(stamps[::-1], return_index=True)
+	return distinct, values[::-1][last]
+
+"""
+INPUT : n         - length of the merged series
+        positions - where in the merged series each known value sits
+        values    - the known values (NaN counts as unknown)
+OUTPUT: the merged series, linearly interpolated by position between known
+        values and held at the last one after it; like pandas'
+        Series.interpolate(), anything before the first known value stays NaN
+"""
+def _interpolated(n, positions, values):
+	known  = ~np.isnan(values)
+	merged = np.full(n, np.nan)
+	if not known.any():
+		return merged
+	merged = np.interp(np.arange(n), positions[known], values[known])
+	merged[:positions[known][0]] = np.nan
+	return merged
+
 """
 -------------------------- Question Variable Parsers ---------------------------
 """
 
+"""
+INPUT : points - a RadarTable (or TruthTable)
+        values - an array with one value per row of points
+        sort   - whether to sort the result by (stamp, value)
+OUTPUT: [ ... (stamp, value) ... ], built column-wise from the table
+"""
+def _stampedColumn(points, values, sort=False):
+	stamps = points.stamp
+	if sort:
+		order  = np.lexsort((values, stamps))
+		stamps = stamps[order]
+		values = values[order]
+	return list(zip(toDatetimes(stamps), values.tolist()))
+
 def distancesFromRadarParser(RD, TD=None):
-	return sorted(
-		[(point.stamp, point.distance) for point in RD.getPoints()])
+	points = RD.getPoints()
+	return _stampedColumn(points, points.distance, sort=True)
 
 def confidencesOfRadar(RD, TD=None):
-	return sorted(
-		[(point.stamp, point.confidence) for point in RD.getPoints()])
+	points = RD.getPoints()
+	return _stampedColumn(points, points.confidence, sort=True)
 
 def altitudesOfRadarTarget(RD, TD=None):
-	return sorted(
-		[(point.stamp, point.altitude) for point in RD.getPoints()])
-
-def _stampedSecondWindowFrequencies(some_points):
-	stamped_second_window_frequencies = []
-	for point in some_points:
-		second_window = [
-			s for s in some_points
-			if abs((point.stamp - s.stamp).total_seconds()) <= 1
-			and s != point
-		]
-		frequency = len(second_window)
-		stamped_second_window_frequencies.append((point.stamp, \
-			                                      frequency))
-
-	return stamped_second_window_frequencies
-
-def frequenciesOfValidRadarPoints(RD, TD):
-	pac_points = []
-	
-	for point in RD.getPoints():
-
-		if PAC(point.stamp,     \
-			   point.latitude,  \
-			   point.longitude, \
-			   point.altitude,  \
-			   TD.getPoints()):
-
-			pac_points.append(point)
-	
-	return _stampedSecondWindowFrequencies(pac_points)
-
-def frequenciesOfInValidRadarPoints(RD, TD):
-	not_pac_points = []
-	
-	for point in RD.getPoints():
-
-		if not PAC(point.stamp,     \
-			       point.latitude,  \
-			       point.longitude, \
-			       point.altitude,  \
-			       TD.getPoints()):
-
-			not_pac_points.append(point)
-
-	return _stampedSecondWindowFrequencies(not_pac_points)
+	points = RD.getPoints()
+	return _stampedColumn(points, points.altitude, sort=True)
+
+"""
+INPUT : stamps - datetime64 array, one entry per point
+        window - half-width of the window, in seconds
+OUTPUT: [ ... (stamp, number of *other* points within window seconds) ... ],
+        in the order of stamps.  Counted with two binary searches per point
+        on a sorted copy of the stamps, rather than by comparing every pair.
+"""
+def _stampedSecondWindowFrequencies(stamps, window=1):
+	# Points carry microsecond stamps, and the window test used to be
+	# abs(timedelta.total_seconds()) <= window; find the widest whole number
+	# of microseconds that passes that test.
+	limit = int(math.floor(window * 1e6))
+	while (limit + 1) / 1e6 <= window:
+		limit += 1
+	while limit >= 0 and limit / 1e6 > window:
+		limit -= 1
+
+	stamps   = np.asarray(stamps).astype("datetime64[us]")
+	ticks    = stamps.astype(np.int64)
+	in_order = np.sort(ticks)
+
+	frequencies = np.searchsorted(in_order, ticks + limit, side="right") \
+	            - np.searchsorted(in_order, ticks - limit, side="left" ) - 1
+
+	return list(zip(toDatetimes(stamps), frequencies.tolist()))
+
+"""
+OUTPUT: mathUtils.PAC of every radar point in RD against the truth in TD, as
+        one boolean array (see pacIndex.pac_mask)
+"""
+def _radarPAC(RD, TD):
+	mask, _ = pac_mask(RD.getPoints(), TD.getPoints())
+	return mask
+
+"""
+The valid and invalid frequency parsers both need _radarPAC of the block.
+Given a ParserMemo (ParserMemo passes itself to parsers that take one), they
+share a single answer through it.
+"""
+def frequenciesOfValidRadarPoints(RD, TD, window=1, memo=None):
+	pac = _radarPAC(RD, TD) if memo == None else memo(_radarPAC, RD, TD)
+	return _stampedSecondWindowFrequencies(RD.getPoints().stamp[pac], window)
+
+def frequenciesOfInValidRadarPoints(RD, TD, window=1, memo=None):
+	pac = _radarPAC(RD, TD) if memo == None else memo(_radarPAC, RD, TD)
+	return _stampedSecondWindowFrequencies(RD.getPoints().stamp[~pac], window)
 
 def verticalVelocities(RD, TD=None):
-	return [
-		(point.stamp, point.verticalVelocity) 
-	    for point in RD.getPoints()
-	]
+	points = RD.getPoints()
+	return _stampedColumn(points, points.verticalVelocity)
 
 def horizontalSpeeds(RD, TD=None):
-	return [
-		(point.stamp, (point.xVelocity ** 2 + point.yVelocity ** 2) ** 0.5) 
-	    for point
-	    in RD.getPoints()
-	]
+	points = RD.getPoints()
+	return _stampedColumn(points, 
+		                  (points.xVelocity ** 2 + points.yVelocity ** 2) ** 0.5)
 
 def xVelocities(RD, TD=None):
-	return [
-		(point.stamp, point.xVelocity) 
-	    for point
-	    in RD.getPoints()
-	]
+	points = RD.getPoints()
+	return _stampedColumn(points, points.xVelocity)
 
 def yVelocities(RD, TD=None):
-	return [
-		(point.stamp, point.yVelocity) 
-	    for point 
-	    in RD.getPoints()
-	]
+	points = RD.getPoints()
+	return _stampedColumn(points, points.yVelocity)
+
+"""
+Remembers what each parser returned for a block, so that a parser asked about
+the same (RD, TD) block by several questions runs only once.  Blocks are
+told apart by identity; clear() between blocks keeps memory to one block.
+"""
+class ParserMemo(object):
+
+	def __init__(self):
+		self.results   = {} # (parser, id(RD), id(TD)) -> (RD, TD, result)
+		self.takesMemo = {} # parser -> whether it has a memo argument
+		self.hits      = 0
+		self.misses    = 0
+
+	def __call__(self, parser, RD, TD):
+		key = (parser, id(RD), id(TD))
+		if key in self.results:
+			self.hits += 1
+			return self.results[key][2]
+		self.misses += 1
+		if parser not in self.takesMemo:
+			self.takesMemo[parser] = \
+				"memo" in inspect.signature(parser).parameters
+		if self.takesMemo[parser]:
+			result = parser(RD, TD, memo=self)
+		else:
+			result = parser(RD, TD)
+		# RD and TD are held on to so that their ids cannot be reused.
+		self.results[key] = (RD, TD, result)
+		return result
+
+	def clear(self):
+		self.results = {}
+
+	def quickStats(self):
+		return "Parser Memo Quick Stats : [ " + str(self.hits) + " hits, " \
+		       + str(self.misses) + " misses ]"
 
 INDEPENDENTS = [
 	(distancesFromRadarParser, "Distance from RADAR (m)"),
@@ -285,4 +356,21 @@ DEPENDENTS = [
 	(confidencesOfRadar,              "Reported RADAR confidence (%)"),
 	(frequenciesOfValidRadarPoints,   "Frequency of valid RADAR points (1/s)"),
 	(frequenciesOfInValidRadarPoints, "Frequency of invalid RADAR points (1/s)")
-]
\ No newline at end of file
+]
+
+"""
+INPUT : window - half-width, in seconds, of the window the frequency parsers
+                 count other points in
+OUTPUT: DEPENDENTS, with the frequency parsers set to that window
+"""
+def dependentsWithWindow(window=1):
+	if window == 1:
+		return DEPENDENTS
+	unit = "(points within " + str(window) + " s)"
+	return [
+		(functools.partial(parser, window=window), name.replace("(1/s)", unit))
+		if parser in (frequenciesOfValidRadarPoints,
+			          frequenciesOfInValidRadarPoints)
+		else (parser, name)
+		for (parser, name) in DEPENDENTS
+	]
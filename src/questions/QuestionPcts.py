@@ -31,6 +31,12 @@ class QuestionPcts:
         self.vy= vy
         return math.sqrt(self.vx * self.vx + self.vy * self.vy);  # This can maybe go in MathUtils if needed elsewhere
 
+    # Radar and truth points come out of their tables as copies of the rows,
+    # so a conversion has to be made to the table to last.
+    def toFeet(self, table, i):
+        table.altitude[i] = table.altitude[i] * self.metersToFeet
+        return table.altitude[i]
+
     def invalidvsValidTracks(self, radarD):
         try: 
             minAltitude = RADAR_FILTER["minAltitude"]
@@ -48,8 +54,8 @@ class QuestionPcts:
             invalidArr = []
             for key in radarD.points:
                 points = radarD.points[key]
+                points.altitude = points.altitude * self.metersToFeet  # convert to feet
                 for p in points:
-                    p.altitude = p.altitude * self.metersToFeet  # convert to feet
                     hzSpeed = self.getHZSpeedFromRadar(p.xVelocity, p.yVelocity) 
                     if (p.altitude  > minAltitude and hzSpeed > minHorizontalSpeed):
                         if p.trackID not in validArr:
@@ -141,9 +147,10 @@ class QuestionPcts:
             for key in radarD.points:
                 points = radarD.points[key]
 
-            for m in mavlD.getPoints():
+            mavPoints = mavlD.getPoints()
+            for i, m in enumerate(mavPoints):
                 if (sampleCnt < 100):
-                    m.altitude  = m.altitude  * self.metersToFeet  
+                    m.altitude  = self.toFeet(mavPoints, i)
                     hzSpeed =  self.getHZSpeedFromMAVLink(vx, vy)
                     if (m.altitude  < maxAltitude and m.altitude > minAltitude and hzSpeed > minHorizontalSpeed and hzSpeed < maxHorizontalSpeed):   
                         mavAltitude.append(m.altitude ) 
@@ -151,9 +158,9 @@ class QuestionPcts:
                         mavLon.append(m.longitude) 
                         mavHZSpeed.append(hzSpeed)
   
-                        for p in points:
+                        for j, p in enumerate(points):
                             if (abs(p.stamp.timestamp() * 1000 - m.stamp.timestamp() * 1000) < 103):
-                                p.altitude = p.altitude * self.metersToFeet  
+                                p.altitude = self.toFeet(points, j)
                                 hzSpeed = self.getHZSpeedFromRadar(p.xVelocity, p.yVelocity) 
 
                             if (p.altitude< maxAltitude and p.altitude > minAltitude and hzSpeed > minHorizontalSpeed and hzSpeed < maxHorizontalSpeed):   
@@ -8,9 +8,14 @@ purpose : To find information on how long it took an aircraft to be detected
 from src.questions.Question import Question
 from src.radarData          import *
 from src.Encounter          import *
+from src.timeIndex          import TimeIndex
+from src.fovClassifier      import FoVClassifier
+from src.radarResolver      import getRadarResolver
 from datetime               import datetime
 from datetime               import timedelta
 
+import numpy as np
+
 
 # Goal: Generate a list of time it took radar to detect, and a histogram from 
 #       that list.
@@ -26,8 +31,11 @@ class TimeToDetect(Question):
         encounter_RD_grab_range=timedelta(seconds=60),
         encounter_TD_grab_range=timedelta(seconds=60)):
 
-        self.RD_ = RD.points
-        self.TD_ = TD.points
+        # Encounters annotate individual points, so work on materialized rows.
+        self.RD_ = list(RD.points)
+        self.TD_ = list(TD.points)
+        self.RD_index_ = TimeIndex([point.stamp for point in self.RD_])
+        self.TD_index_ = TimeIndex([point.stamp for point in self.TD_])
         self.RD_source_ , self.TD_source_ = self.check_RD_TD_sources()
         
         if len(self.TD_source_) > 1:
@@ -73,23 +81,31 @@ class TimeToDetect(Question):
         return RD_sources, TD_sources
 
     # Get the appropriate radar physical and FoV information.
+    # Both are resolved once per radar log per run; see src/radarResolver.py
     def get_radar_physical_(self):
-        return get_radar_physical(self.RD_source_)
+        return getRadarResolver().physical(self.RD_source_)
     
     def get_radar_fov_(self):
-        return get_radar_fov(self.RD_source_)
+        return getRadarResolver().fov(self.RD_source_)
 
     # Run the truth information through the FoV test sequentially, and append 
     # a in or out.
+    # The radar's frame is worked out once and every truth point is classified
+    # in one pass (see src/fovClassifier.py).
     def classify_in_fov(self):
         
-        for _id, tpoint in enumerate(self.TD_):
-            
-            fov_check = is_point_in_fov(self.RD_[0],
-                                        tpoint,
-                                        fov=self.RD_fov_,
-                                        physical=self.RD_physical_,
-                                        calculate_Az_El_when_out_of_range=False)
+        if self.RD_physical_ == None:
+            # is_point_in_fov gives None for every point in this case
+            for tpoint in self.TD_:
+                tpoint.fov_test = None
+            return
+        
+        classifier = FoVClassifier(self.RD_fov_, self.RD_physical_)
+        
+        fov_checks = classifier.classifyPoints(
+            self.TD_, calculate_Az_El_when_out_of_range=False)
+        
+        for _id, fov_check in enumerate(fov_checks):
             
             self.TD_[_id].fov_test = fov_check
 
@@ -97,48 +113,56 @@ class TimeToDetect(Question):
     # Make a list of encounters
     def populate_encounter_list(self):
         
-        last_in_FoV = False # setup
+        # Truth points without a FoV test are skipped, so a transition is 
+        # judged against the previous point that has one.
+        tested = [
+            _id for _id, tpoint in enumerate(self.TD_)
+            if tpoint != None and tpoint.fov_test != None
+        ]
         
-        # iterate through truth point list
-        for _id, tpoint in enumerate(self.TD_):
-
-            if tpoint == None or tpoint.fov_test == None:
-                continue
+        # As the original point-by-point loop did: any truthy is_in_fov enters
+        # the FoV, but only a plain False (is_point_in_fov's answer for a point
+        # out of range) leaves it.  A numpy False (in range, but outside the
+        # heading or elevation limits) leaves the state as it was.
+        #   1 - enters, 0 - leaves, -1 - neither
+        moves = np.array([
+            1 if is_in_fov else (0 if is_in_fov is False else -1)
+            for is_in_fov in (self.TD_[_id].fov_test.is_in_fov 
+                              for _id in tested)
+        ], dtype=np.int8)
+        
+        # In the FoV after point k is the last enter/leave move up to k.
+        decided = np.where(moves >= 0, np.arange(len(moves)), -1)
+        decided = np.maximum.accumulate(decided)
+        in_FoV  = (decided >= 0) & (moves[np.maximum(decided, 0)] == 1)
+        
+        # out --> in transitions (being in the FoV at the start counts as one)
+        last_in_FoV = np.concatenate(([False], in_FoV[:-1]))
+        entering    = np.flatnonzero((moves == 1) & ~last_in_FoV)
+        
+        for k in entering.tolist():
             
-            # if last_in_FoV is False, and tpoint.fov_test.is_in_fov is True
-            if last_in_FoV is False and tpoint.fov_test.is_in_fov:
-                
-                # set last_in_Fov to True
-                last_in_FoV = True
-                
-                # Begin encounter construction:
-                encounter_time = tpoint.stamp
-                
-                # Find truth data around the encounter point
-                nearby_truths = self.list_points_within_timerange(
-                    self.TD_, encounter_time, self.encounter_TD_grab_range)
-                
-                # Find radar data around the encounter point
-                nearby_radar_points = self.list_points_within_timerange(
-                    self.RD_, encounter_time, self.encounter_RD_grab_range)
-
-                # Construct an encounter and append it to the encounter list
-                encounter = Encounter(tpoint, 
-                                      nearby_radar_points, 
-                                      nearby_truths)
-                
-                self.encounter_list.append(encounter)
+            tpoint = self.TD_[tested[k]]
             
-            # else if last_in_FoV is True and tpoint.fov_test.is_in_fov is False
-            elif last_in_FoV and tpoint.fov_test.is_in_fov is False:
-                
-                # set last_in_FoV to False
-                last_in_FoV = False
+            # Begin encounter construction:
+            encounter_time = tpoint.stamp
             
-            # else do nothing, because it is just outside of the FoV, or still 
-            # inside the FoV
-            else:
-                pass
+            # Find truth data around the encounter point
+            nearby_truths = self.list_points_within_timerange(
+                self.TD_, encounter_time, self.encounter_TD_grab_range,
+                self.TD_index_)
+            
+            # Find radar data around the encounter point
+            nearby_radar_points = self.list_points_within_timerange(
+                self.RD_, encounter_time, self.encounter_RD_grab_range,
+                self.RD_index_)
+
+            # Construct an encounter and append it to the encounter list
+            encounter = Encounter(tpoint, 
+                                  nearby_radar_points, 
+                                  nearby_truths)
+            
+            self.encounter_list.append(encounter)
 
     # Process the list of encounters to get a list of time to detect
     def process_encounter_list(self):
@@ -160,11 +184,16 @@ class TimeToDetect(Question):
 
 
     # Useful functions
-    def list_points_within_timerange(self, points, target_time, time_delta):
-        valid_points = []
+    # index, if given, is a TimeIndex over the stamps of points.
+    def list_points_within_timerange(self, points, target_time, time_delta,
+                                     index=None):
+        if index is None:
+            index = TimeIndex([point.stamp for point in points])
         
-        for point in points:
-            if abs(point.stamp - target_time) < time_delta:
-                valid_points.append(point)
+        within = index.between(target_time - time_delta,
+                               target_time + time_delta,
+                               closed=False)
         
-        return valid_points
+        if isinstance(within, slice):
+            return points[within]
+        return [points[i] for i in within.tolist()]
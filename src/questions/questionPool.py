@@ -0,0 +1,110 @@
+"""
+file    : questionPool.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : Answer the (block, independent, dependent) questions of a run and
+          save their plots, either one after another in this process or
+          spread over a pool of worker processes.
+"""
+import contextlib
+import io
+
+from concurrent.futures     import ProcessPoolExecutor
+from src.questions.Question import Question, ParserMemo, \
+                                   INDEPENDENTS, DEPENDENTS
+
+"""
+INPUT : RD, TD         - one block
+        countI, countD - which INDEPENDENTS and DEPENDENTS entry to ask about
+        memo           - a ParserMemo to take parser answers from
+        dependents     - the DEPENDENTS table to use (see
+                         Question.dependentsWithWindow)
+OUTPUT: nothing; the plot, if any, is saved to disk
+"""
+def answerQuestion(RD, TD, countI, countD, memo, dependents=DEPENDENTS):
+
+	(independent_parser, independent_name) = INDEPENDENTS[countI]
+	(dependent_parser,   dependent_name  ) = dependents  [countD]
+
+	timestamped_INDEPENDENT = memo(independent_parser, RD, TD)
+	timestamped_DEPENDENT   = memo(dependent_parser,   RD, TD)
+
+	answer = Question(
+		timestamped_X=timestamped_INDEPENDENT,
+		timestamped_Y=timestamped_DEPENDENT,
+		X_axis_name=independent_name,
+		Y_axis_name=dependent_name)
+
+	if answer.isNonTrivial():
+		answer.plotXY(save=True)
+
+# Per-worker state, set up once by _initWorker: the blocks themselves (so
+# that a task is just a block index and its question numbers), and a memo.
+_BLOCKS     = None
+_DEPENDENTS = DEPENDENTS
+_MEMO       = None
+
+def _initWorker(blocks, dependents=DEPENDENTS):
+	global _BLOCKS, _DEPENDENTS, _MEMO
+	_BLOCKS     = blocks
+	_DEPENDENTS = dependents
+	_MEMO       = ParserMemo()
+
+"""
+INPUT : task - (block index, [ ... (countI, countD) ... ]), every question
+               asked about one block
+OUTPUT: (what the questions printed, memo hits, memo misses)
+"""
+def _answerBlock(task):
+	(block, questions) = task
+	(RD, TD) = _BLOCKS[block]
+	(hits, misses) = (_MEMO.hits, _MEMO.misses)
+	out = io.StringIO()
+	with contextlib.redirect_stdout(out):
+		for (countI, countD) in questions:
+			answerQuestion(RD, TD, countI, countD, _MEMO, _DEPENDENTS)
+	_MEMO.clear()
+	return out.getvalue(), _MEMO.hits - hits, _MEMO.misses - misses
+
+"""
+OUTPUT: units as [ ... (block index, [ ... (countI, countD) ... ]) ... ], one
+        entry per run of units about the same block
+"""
+def _blockTasks(units):
+	tasks = []
+	for (block, countI, countD) in units:
+		if len(tasks) == 0 or tasks[-1][0] != block:
+			tasks.append((block, []))
+		tasks[-1][1].append((countI, countD))
+	return tasks
+
+"""
+INPUT : blocks - [ ... (RD, TD) ... ]
+        units  - [ ... (block index, countI, countD) ... ], grouped by block
+        jobs   - how many processes to use (1 answers in this process)
+        memo   - a ParserMemo; its hit/miss counts are updated either way
+        dependents - the DEPENDENTS table to use
+OUTPUT: nothing.  Each block goes to one worker whole, so its parsers run
+        once whatever jobs is; printouts are replayed in unit order, so the
+        output (and every saved plot) is the same whatever jobs is.
+"""
+def answerQuestions(blocks, units, jobs=1, memo=None, dependents=DEPENDENTS):
+
+	memo  = ParserMemo() if memo == None else memo
+	tasks = _blockTasks(units)
+
+	if jobs <= 1 or len(tasks) <= 1:
+		for (block, questions) in tasks:
+			(RD, TD) = blocks[block]
+			for (countI, countD) in questions:
+				answerQuestion(RD, TD, countI, countD, memo, dependents)
+			memo.clear()
+		return
+
+	with ProcessPoolExecutor(max_workers=min(jobs, len(tasks)),
+		                     initializer=_initWorker,
+		                     initargs=(blocks, dependents)) as pool:
+		for (printed, hits, misses) in pool.map(_answerBlock, tasks):
+			print(printed, end="")
+			memo.hits   += hits
+			memo.misses += misses
@@ -0,0 +1,141 @@
+"""
+file    : radarConfigTimeline.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : The RadarConfig_*.json files of one site (an echoguard folder), in
+          order of the time each took effect, with their radars parsed into
+          Physical / FoV objects.  Finding the config in effect at a given
+          time is a binary search.
+"""
+import os
+import dateutil.parser
+
+from datetime           import timedelta
+from src.FoV            import FoV
+from src.Physical       import Physical
+from src.configIndex    import getConfigIndex
+from src.timeIndex      import TimeIndex
+
+"""
+INPUT : JSON - the contents of a RadarConfig_*.json file
+OUTPUT: [ ... Physical ... ], one per selected radar in the file, each with
+        its FoV (the tracking limits) as .fov
+"""
+def radarConfigRadars(JSON):
+
+	physicals = []
+
+	for r in JSON["radars"]:
+
+		if not r["general"]["selected"]:
+			continue
+
+		physical = Physical()
+
+		physical.label      = r["general"]["label"     ]
+		physical.scriptPath = r["general"]["scriptPath"]
+
+		physical.lat     = r["physical"]["latitude"     ]
+		physical.lon     = r["physical"]["longitude"    ]
+		physical.alt     = r["physical"]["altitudeMeter"]
+		physical.heading = r["physical"]["headingDegree"]
+		physical.pitch   = r["physical"]["pitchDegree"  ]
+		physical.roll    = r["physical"]["rollDegree"   ]
+
+		physical.latUnit     = "degree"
+		physical.lonUnit     = "degree"
+		physical.altUnit     = "meter"
+		physical.headingUnit = "degree"
+		physical.pitchUnit   = "degree"
+		physical.rollUnit    = "degree"
+
+		fov = FoV()
+
+		fov.range     = r["fov"]["maxRangeMeter"      ]
+		fov.rangeUnit = "meter"
+		fov.minRange  = r["fov"]["minRangeMeter"      ]
+		fov.AzMin     = r["fov"]["fovAzMinTrackDegree"]
+		fov.AzMinUnit = "degree"
+		fov.AzMax     = r["fov"]["fovAzMaxTrackDegree"]
+		fov.AzMaxUnit = "degree"
+		fov.ElMin     = r["fov"]["fovElMinTrackDegree"]
+		fov.ElMinUnit = "degree"
+		fov.ElMax     = r["fov"]["fovElMaxTrackDegree"]
+		fov.ElMaxUnit = "degree"
+
+		physical.fov = fov
+
+		physicals.append(physical)
+
+	return physicals
+
+class RadarConfigTimeline(object):
+
+	"""
+	folder                - the site's echoguard folder
+	RadarConfig_time_zone - offset of the (local) times in the file names
+	                        from UTC
+	"""
+	def __init__(self, folder, RadarConfig_time_zone=timedelta(hours=-9)):
+
+		self.folder = folder
+		self.radars = {} # config file -> [ Physical ], parsed on first use
+
+		try:
+			names = [e.name for e in os.scandir(folder) if e.is_file()]
+		except OSError:
+			names = []
+
+		dated = []
+
+		for config_name in names:
+
+			if 'RadarConfig' not in config_name:
+				continue
+
+			date_string = config_name.split('_')[1].split('.')[0]
+
+			date = dateutil.parser.isoparse(date_string) - RadarConfig_time_zone
+
+			dated.append((date, os.path.join(folder, config_name)))
+
+		dated.sort()
+
+		self.times = [date for (date, _) in dated]
+		self.files = [file for (_, file) in dated]
+		self.index = TimeIndex(self.times)
+
+	def __len__(self):
+		return len(self.files)
+
+	"""
+	OUTPUT: the RadarConfig file whose time is closest to t (the earlier one
+	        on a tie), or None if the site has none
+	"""
+	def fileAt(self, t):
+		i = self.index.nearest(t)
+		return None if i == None else self.files[i]
+
+	"""
+	OUTPUT: the radars ([ Physical ], see radarConfigRadars) configured in
+	        the RadarConfig file closest to t
+	"""
+	def radarsAt(self, t):
+		file = self.fileAt(t)
+		if file == None:
+			return []
+		if file not in self.radars:
+			JSON = getConfigIndex().radarConfig(file)
+			self.radars[file] = [] if JSON == None else radarConfigRadars(JSON)
+		return self.radars[file]
+
+TIMELINES = {}
+
+"""
+OUTPUT: the RadarConfigTimeline of folder, built the first time it is asked for
+"""
+def getRadarConfigTimeline(folder, RadarConfig_time_zone=timedelta(hours=-9)):
+	key = (folder, RadarConfig_time_zone)
+	if key not in TIMELINES:
+		TIMELINES[key] = RadarConfigTimeline(folder, RadarConfig_time_zone)
+	return TIMELINES[key]
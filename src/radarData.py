@@ -17,15 +17,23 @@ from   datetime                import datetime
 from   datetime                import timedelta
 from   src.Data                import Data
 from   glob                    import glob
-from   src.mathUtils           import targetBearing,  \
-                                      targetPosition, \
-                                      distanceKM
-from   src.genericDataUtils    import getConfigName
+from   src.mathUtils           import targetBearing,       \
+                                      targetPosition,      \
+                                      targetPositionArray, \
+                                      distanceKM,          \
+                                      distanceKMArray
+from   src.configIndex         import getConfigIndex
+from   src.ingest              import parseFiles
+from   src.folderScan          import scanFolder
 from   src.plotGraphs          import *
 from   src.Point               import Point
+from   src.trackTable          import RadarTable
 from   src.Physical            import Physical
-from   src.FoV                 import FoV
-from   src.dateParser          import parseDate
+from   src.FoV                 import FoV, FoVTest
+from   src.dateParser          import parseDate, parseDates
+from   src.jsonStream          import iterJSONArray
+from   src.radarConfigTimeline import getRadarConfigTimeline, \
+                                      radarConfigRadars
 import geopy.distance
 
 class RadarData(Data):
@@ -37,19 +45,28 @@ class RadarData(Data):
 	# Should fill in the data from the folder
 	def fromFolder(self, folder):
 		self.folder = folder
-		points = {}
+		getConfigIndex().addFolder(folder)
+		tables = {}
 		rcvrs  = {}
-		for file in glob(folder + "**/*radar.log", recursive=True):
-			subpoints = getRadarPoints(file)
+		files  = scanFolder(folder).entries("radar")
+		for file, subpoints in zip(files, parseFiles(getRadarPoints, 
+			                                         files, 
+			                                         self.workers,
+			                                         self.cache)):
+			file = file.path
 			if subpoints != None:
-				subname = getConfigName(file)
-				if subname == None:
-					subname = file.split("/")[-1].split(".")[0].strip()
-				if subname in points:
-					points[subname] += subpoints
+				# One table per log file.  (Keying by the name in the *_config.log
+				# would merge logs from radars at different sites, e.g. every
+				# "echoguard".)
+				subname = file.split("/")[-1].split(".")[0].strip()
+				if subname in tables:
+					tables[subname].append(subpoints)
 				else:
-					points[subname] = subpoints
-		self.points = points 
+					tables[subname] = [subpoints]
+		self.points = {
+			subname : RadarTable.concat(subtables)
+			for subname, subtables in tables.items()
+		}
 
 	"""
 	Extra Functionality That Extends Data Class
@@ -60,7 +77,7 @@ class RadarData(Data):
 		if self.radarLocations != None:
 			return self.radarLocations
 		rcvrs = []
-		for file in glob(folder + "**/*radar.log", recursive=True):
+		for file in scanFolder(folder).files("radar"):
 			conf_rcvr = getRadarConfigLocation(file)
 			if conf_rcvr != None:
 				lat, lon, alt, ori = conf_rcvr
@@ -91,93 +108,69 @@ OUTPUT: the location (lat,    lon,    alt,   ori   ) in units of
         of the RADAR, if we can determine it; else None
 """
 def getRadarConfigLocation(radar_file_name):
-	
-	radar_config_file_name = radar_file_name.replace(".log", "_config.log")
-	
-	lat, lon, alt, ori = None, None, None, None
-	
-	try:
-		with open(radar_config_file_name, "r") as fr:
-			
-			stuff = json.loads(fr.read())
-			lon   = stuff["receiver"]["longitude"  ]["value"]
-			lat   = stuff["receiver"]["latitude"   ]["value"]
-			alt   = stuff["receiver"]["elevation"  ]["value"]
-			ori   = stuff["receiver"]["orientation"]["value"]
-			
-			# Check membership instead of equality due to peculiarities of
-			# Windows encoding.
-			assert("°" in stuff["receiver"]["longitude"  ]["unit"])
-			assert("°" in stuff["receiver"]["latitude"   ]["unit"])
-			assert("m" in stuff["receiver"]["elevation"  ]["unit"])
-			assert("°" in stuff["receiver"]["orientation"]["unit"])
-
-		return lat, lon, alt, ori
-	
-	except Exception as e:
-		return None
+	return getConfigIndex().receiver(radar_file_name)
 
 
 """
 INPUT : radar_file_name - the file name of the RADAR log file to be parsed
-OUTPUT: the data from radar_file_name, in the format 
-        [ ... (time, conf, lat, lon, alt, dist) ...]
+OUTPUT: the data from radar_file_name, as a RadarTable; None if the RADAR 
+        location is unknown, or an empty RadarTable if the log cannot be parsed.
+        The log is streamed into per-column lists, so no per-entry dict or 
+        Point outlives its own iteration, and the whole file is geolocated
+        in one vectorized call.
 """
 def getRadarPoints(radar_file_name):
 	receiver = getRadarConfigLocation(radar_file_name)
 	if receiver == None:
 		return None
-	points = []
+	columns = { name : [] for name in ("stamp",) + RadarTable.FLOAT_COLUMNS
+	                                             + RadarTable.TEXT_COLUMNS }
 	try:
-		with open(radar_file_name, "r") as fr:
-			stuff = json.loads(fr.read())
-			for entry in stuff:
-				(rn, az, el) = (entry["rest"], entry["azest"], entry["elest"])
-				
-				(velVert, velX, velY) = (entry["velzest"], 
-					                     entry["velxest"], 
-					                     entry["velyest"])
-
-				(lat, lon, alt) = targetPosition(rn, az, el, receiver)
-				# print("Passing in: ", lat, lon, receiver[0], receiver[1])
-				dist = 1000 * distanceKM(lat, lon, receiver[0], receiver[1])
-				time = parseDate(entry["timeStamp"])
-				
-				conf = entry["confidenceLevel"]
-				trackID = entry["id"]
-				
-				p                  = Point()
-				p.stamp            = time
-				p.confidence       = conf
-				p.latitude         = lat
-				p.longitude        = lon
-				p.altitude         = alt
-				p.distance         = dist
-				p.verticalVelocity = velVert
-				p.xVelocity        = velX
-				p.yVelocity        = velY
-				p.azimuth          = az
-				p.elevation        = el
-				p.range            = rn
-				p.src              = radar_file_name
-				p.trackID 		   = trackID
-				points.append(p)
+		for entry in iterJSONArray(radar_file_name):
+			columns["range"           ].append(entry["rest"           ])
+			columns["azimuth"         ].append(entry["azest"          ])
+			columns["elevation"       ].append(entry["elest"          ])
+			columns["verticalVelocity"].append(entry["velzest"        ])
+			columns["xVelocity"       ].append(entry["velxest"        ])
+			columns["yVelocity"       ].append(entry["velyest"        ])
+			columns["stamp"           ].append(entry["timeStamp"      ])
+			columns["confidence"      ].append(entry["confidenceLevel"])
+			columns["trackID"         ].append(entry["id"             ])
+		columns["stamp"] = parseDates(columns["stamp"])
 	except Exception as e:
-		return []
-	return points
+		return RadarTable()
+
+	(rn, az, el) = (np.asarray(columns["range"    ], dtype=np.float64),
+	                np.asarray(columns["azimuth"  ], dtype=np.float64),
+	                np.asarray(columns["elevation"], dtype=np.float64))
+
+	(lat, lon, alt) = targetPositionArray(rn, az, el, receiver)
+	dist = 1000 * distanceKMArray(lat, lon, receiver[0], receiver[1])
+
+	columns["latitude" ] = lat
+	columns["longitude"] = lon
+	columns["altitude" ] = alt
+	columns["distance" ] = dist
+
+	return RadarTable.fromColumns(radar_file_name, **columns)
 """
 Function to find the first timestamp in a _radar.log file.
 This is here because the filename uses 12 hr format, but does not specify AM or
 PM, so the point in the file with a valid timestamp should be used instead.
 
-Adapted code from getRadarPoints
+Adapted code from getRadarPoints.  Each log is read (up to its first entry)
+once; later calls are answered from FIRST_TIMESTAMPS.
 """
+FIRST_TIMESTAMPS = {}
+
 def get_first_timestamp_in_radarLog(radar_file_name):
-	with open(radar_file_name, "r") as fr:
-		stuff = json.loads(fr.read())
-		for entry in stuff:
-			time = parseDate(entry["timeStamp"])
-			return time
+	if radar_file_name not in FIRST_TIMESTAMPS:
+		FIRST_TIMESTAMPS[radar_file_name] = None
+		for entry in iterJSONArray(radar_file_name):
+			FIRST_TIMESTAMPS[radar_file_name] = parseDate(entry["timeStamp"])
+			break
+	return FIRST_TIMESTAMPS[radar_file_name]
+
 """
 Find radar config file. Given a radar Point will find the closest timestamped 
 echogarud RadarConfig file and return the name.
@@ -200,9 +193,7 @@ def find_RadarConfig(
 	RadarConfig_time_zone=timedelta(hours=-9), 
 	use_filename_date=False):
 	
-	radar_log_file = ('..\\' + radar_point.src)    \
-		if 'src' in os.path.dirname(__file__) else \
-		radar_point.src
+	radar_log_file = radar_point.src
 
 	# Parse datetime out of the radar_log_file
 	if use_filename_date:
@@ -215,42 +206,28 @@ def find_RadarConfig(
 	
 		log_date = get_first_timestamp_in_radarLog(radar_log_file)
 
-	# Get list of RadarConfig files
+	# The RadarConfig files sit in an echoguard folder next to the log; each
+	# folder's files are listed and dated once (see radarConfigTimeline.py)
 	echoguard_folder = os.path.join(os.path.dirname(radar_log_file), 
 		                            'echoguard')
-	
-	echoguard_folder = ('..\\' + echoguard_folder) \
-				if 'src' in os.path.dirname(__file__) else \
-				echoguard_folder
-	radar_filenames = next(os.walk(echoguard_folder), (None, None, []))[2]
 
-	date_list = {}
+	timeline = getRadarConfigTimeline(echoguard_folder, RadarConfig_time_zone)
 
-	# Parse into a list of datetimes
-	for config_name in radar_filenames:
-		
-		if 'RadarConfig' in config_name:
-		
-			date_string = config_name.split('_')[1].split('.')[0]
-			
-			date = dateutil.parser.isoparse(date_string) - RadarConfig_time_zone
-			
-			date_list.update({date: config_name})
-
-	# Find the closest *maybe prior* datetime and return the RadarConfig paths
-	closest_date = min(date_list, key=lambda date: abs(date - log_date))
-	radar_config_file = date_list.get(closest_date)
-
-	return os.join(echoguard_folder, radar_config_file)
+	# Find the closest *maybe prior* datetime and return the RadarConfig path
+	return timeline.fileAt(log_date)
 
 """
 Grabs data from a echoguard RadarConfig file. 
 
-Returns a physical object with a fov object inside 
+Returns a list of physical objects (one per selected radar), each with a fov
+object inside 
 """
 def parse_RadarConfig(radar_RadarConfig_file):
 
-	pass
+	JSON = getConfigIndex().radarConfig(radar_RadarConfig_file)
+	if JSON == None:
+		return None
+	return radarConfigRadars(JSON)
 
 
 # This function will be here for future implementations when a radar 
@@ -347,96 +324,63 @@ def get_radar_fov(radar_log_file):
 		...
 """
 def getPitchRollLatLon(RadarConfigFile, flight=False):
-	config = Point()
-	with open(RadarConfigFile, "r") as fr:
+	return getConfigIndex().pitchRollLatLons(RadarConfigFile, flight)
 
-		JSON = json.loads(fr.read())
-
-		acc = lambda sp : ("/Echo" + ("Flight_" if flight else "Guard_")) in sp
-
-		radars = [
-			r for r in JSON["radars"] if 
-			r["general"]["selected"] and
-			acc(r["general"]["scriptPath"])
-		]
-
-		pitch_roll_lat_lons = [
-			(
-				r["physical"]["pitchDegree"],
-				r["physical"]["rollDegree" ],
-				r["physical"]["latitude"   ],
-				r["physical"]["longitude"  ]
-			)
-			for r in radars
-		]
+def isEchoFlight(log):
+	return getConfigIndex().isEchoFlight(log)
 
-		pitch_roll_lat_lons = list(set(pitch_roll_lat_lons))
+SEARCH_DIR = "../flighthorizon-data/flight-tests/UAF-VAS-FAA/"
 
-		return pitch_roll_lat_lons
+# The folders next to a radar log that RadarConfig files are kept in.
+RADAR_CONFIG_FOLDERS = ("echoguard", "echoflight")
 
-def isEchoFlight(log):
-	ll = log.lower()
-	if "echoguard" in ll:
-		return False
-	if "echoflight" in ll:
-		return True
-	conf = log.replace(".log", "_config.log")
-	try:
-		with open(conf, "r") as fr:
-			txt = fr.read().lower()
-			if "echoguard" in txt:
-				return False
-			if "echoflight" in txt:
-				return True
-	except Exception as e:
-		return None
-	return None
-
-def getPitchAndRoll(
+"""
+INPUT : radar_log_file - a RADAR log
+        searchDir      - where to look for RadarConfig files from the same day
+                         when there are none next to the log
+OUTPUT: the RadarConfig files radar_log_file's pitch and roll are looked up
+        in: from each site folder next to the log, the one in effect when the
+        log starts (see radarConfigTimeline.py); failing that, every
+        RadarConfig file of the log's day under searchDir; or None if the log
+        is not under searchDir either
+"""
+def pitchAndRollSources(
 	radar_log_file,
-	lat,
-	lon,
-	searchDir="../flighthorizon-data/flight-tests/UAF-VAS-FAA/"):
-	# eg: ../flighthorizon-data/flight-tests/UAF-VAS-FAA/2021.01.22-01.29.
-	#     FlightTest1/2021.01.28.Day4/FHLogs/20210128T071018_radar.log
-	datestamp = radar_log_file.split("_radar.log")[0].split("/")[-1]
-	YMD       = datestamp.split("T")[0]
-	year      = YMD[0:4]
-	month     = YMD[4:6]
-	day       = YMD[6: ]
-	assert(searchDir in radar_log_file)
-	candidateConfigs = glob(searchDir + "**/*RadarConfig*.json", recursive=True)
-	filteredCandidates = [c for c in candidateConfigs if year  in c and 
-	                                                     month in c and 
-	                                                     day   in c]
-	flight = isEchoFlight(radar_log_file)
-	if flight == None:
-		return None
-	pitchRollLatLons = list(set([
-		prll for c in filteredCandidates
-		for prll in getPitchRollLatLon(c, flight)
-		if prll != None
-	]))
+	searchDir=SEARCH_DIR,
+	RadarConfig_time_zone=timedelta(hours=-9)):
 
-	best_option, best_distance = None, 0
-	
-	for prll in pitchRollLatLons:
+	try:
+		log_date = get_first_timestamp_in_radarLog(radar_log_file)
+	except ValueError:
+		log_date = None
 
-		dist = geopy.distance.distance(
-			(prll[2], prll[3]), 
-			(lat    , lon    )).m
+	RadarConfigFiles = []
 
-		if best_option == None or best_distance > dist:
+	if log_date != None:
+		for name in RADAR_CONFIG_FOLDERS:
+			timeline = getRadarConfigTimeline(
+				os.path.join(os.path.dirname(radar_log_file), name),
+				RadarConfig_time_zone)
+			RadarConfigFile = timeline.fileAt(log_date)
+			if RadarConfigFile != None:
+				RadarConfigFiles.append(RadarConfigFile)
 
-			best_option   = (prll[0], prll[1])
-			best_distance = dist
+	if len(RadarConfigFiles) > 0:
+		return RadarConfigFiles
 
-	if best_distance > 1:
+	if searchDir not in radar_log_file:
 		return None
 
-	print("best option was " + str(best_distance) + "m from expected location.")
+	return getConfigIndex().sameDayRadarConfigFiles(radar_log_file, searchDir)
 
-	return best_option
+def getPitchAndRoll(
+	radar_log_file,
+	lat,
+	lon,
+	searchDir=SEARCH_DIR):
+	return getConfigIndex().pitchAndRoll(
+		radar_log_file, lat, lon, searchDir,
+		pitchAndRollSources(radar_log_file, searchDir))
 
 # TODO: get_radar_physical needs a link into parse_RadarConfig
 def get_radar_physical(radar_log_file):
@@ -497,7 +441,7 @@ def is_point_in_fov(
 		if physical == None:
 			return None
 	
-	return_object = Point()
+	return_object = FoVTest()
 
 	truthTime, truthLat, truthLon, truthAlt = TD_point.stamp,     \
 	                                          TD_point.latitude,  \
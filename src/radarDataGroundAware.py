@@ -13,8 +13,8 @@ from datetime    import datetime
 from src.Data import Data
 from glob import glob
 from src.mathUtils        import targetBearing, targetPosition, distanceKM
-from src.genericDataUtils import getConfigName
 from src.Point          import Point
+from src.folderScan     import scanFolder
 
 class RadarDataGroundAware(Data):
 
@@ -27,12 +27,13 @@ class RadarDataGroundAware(Data):
 		self.folder = folder
 		points = {}
 		rcvrs  = {}
-		for file in glob(folder + "**/*.vlog", recursive=True):
+		for file in scanFolder(folder).files("vlog"):
 			subpoints = getRadarPoints(file)
 			if subpoints != None:
-				subname = getConfigName(file)
-				if subname == None:
-					subname = file.split("/")[-1].split(".")[0].strip()
+				# One table per log file.  (Keying by the name in the *_config.log
+				# would merge logs from radars at different sites, e.g. every
+				# "echoguard".)
+				subname = file.split("/")[-1].split(".")[0].strip()
 				if subname in points:
 					points[subname] += subpoints
 				else:
@@ -0,0 +1,199 @@
+"""
+file    : radarResolver.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : Work out each radar's Physical and FoV once per run (and, with an
+          on-disk cache, once across runs) instead of once per TimeToDetect.
+"""
+import contextlib
+import io
+import json
+import os
+
+try:
+	import fcntl
+except ImportError:
+	# No advisory locks (e.g. on Windows): saves are still atomic, but two
+	# processes saving at once may drop each other's new entries.
+	fcntl = None
+
+from src.FoV        import FoV
+from src.Physical   import Physical
+from src.parseCache import fingerprint
+from src.radarData  import get_radar_physical, get_radar_fov, \
+                           pitchAndRollSources
+
+# Bump this whenever get_radar_physical or get_radar_fov changes what it
+# returns, so that stale cache entries stop matching.
+RESOLVER_VERSION = 2
+
+RESOLVER_CACHE_FILE = "radars.json"
+
+def _toJSON(thing):
+	return None if thing == None else thing.asDict()
+
+"""
+Hold an exclusive lock on lockFile (created if need be) for the duration.
+"""
+@contextlib.contextmanager
+def _locked(lockFile):
+	with open(lockFile, "a") as fl:
+		if fcntl != None:
+			fcntl.flock(fl.fileno(), fcntl.LOCK_EX)
+		try:
+			yield
+		finally:
+			if fcntl != None:
+				fcntl.flock(fl.fileno(), fcntl.LOCK_UN)
+
+"""
+OUTPUT: the entries in cacheFile, or {} if there is none (or it is unreadable)
+"""
+def _readCache(cacheFile):
+	if not os.path.isfile(cacheFile):
+		return {}
+	try:
+		with open(cacheFile, "r") as fr:
+			return json.loads(fr.read())
+	except Exception as e:
+		print("Ignoring unreadable cache file " + cacheFile)
+		return {}
+
+def _fromJSON(cls, stuff):
+	if stuff == None:
+		return None
+	thing = cls()
+	for (name, value) in stuff.items():
+		setattr(thing, name, value)
+	return thing
+
+class RadarResolver(object):
+
+	def __init__(self):
+		self.physicals = {} # radar log -> Physical, or None
+		self.fovs      = {} # radar log -> FoV
+		self.stored    = {} # radar log -> on-disk cache entry
+		self.fresh     = {} # radar log -> what this process added to its entry
+		self.keys      = {} # radar log -> key
+		self.cacheFile = None
+		self.dirty     = False
+
+	"""
+	cacheFile - a JSON file to read resolved radars from, and save them to
+	rebuild   - if True, never read the existing file (but do overwrite it)
+	"""
+	def useCache(self, cacheFile, rebuild=False):
+		self.cacheFile = cacheFile
+		self.stored    = {} if rebuild else _readCache(cacheFile)
+
+	"""
+	A cached entry is only trusted if the log, its *_config.log (where the
+	location comes from) and the RadarConfig files the pitch and roll come
+	from (see radarData.pitchAndRollSources) are all unchanged.
+	"""
+	def key(self, radar_log_file):
+		if radar_log_file not in self.keys:
+			sources = pitchAndRollSources(radar_log_file)
+			files   = [
+				radar_log_file,
+				radar_log_file.replace(".log", "_config.log")
+			] + sorted([] if sources == None else sources)
+			self.keys[radar_log_file] = [RESOLVER_VERSION] + [
+				None if fp == None else list(fp)
+				for fp in map(fingerprint, files)
+			]
+		return self.keys[radar_log_file]
+
+	def _entry(self, radar_log_file, what):
+		entry = self.stored.get(radar_log_file)
+		if entry == None or what not in entry:
+			return False, None
+		if entry["key"] != self.key(radar_log_file):
+			return False, None
+		return True, entry[what]
+
+	def _remember(self, radar_log_file, what, stuff):
+		if self.cacheFile == None:
+			return
+		entry = self.stored.get(radar_log_file)
+		key   = self.key(radar_log_file)
+		if entry == None or entry["key"] != key:
+			entry = { "key" : key }
+			self.stored[radar_log_file] = entry
+		entry[what] = stuff
+		self.fresh.setdefault(radar_log_file, {})[what] = stuff
+		self.fresh[radar_log_file]["key"] = key
+		self.dirty  = True
+
+	"""
+	OUTPUT: get_radar_physical(radar_log_file), worked out at most once
+	"""
+	def physical(self, radar_log_file):
+		if radar_log_file not in self.physicals:
+			found, stuff = self._entry(radar_log_file, "physical")
+			if found:
+				physical = _fromJSON(Physical, stuff)
+				# Say what working it out said, e.g. "best option was ..."
+				_, printout = self._entry(radar_log_file, "physicalPrintout")
+				print(printout or "", end="")
+			else:
+				out = io.StringIO()
+				try:
+					with contextlib.redirect_stdout(out):
+						physical = get_radar_physical(radar_log_file)
+				finally:
+					print(out.getvalue(), end="")
+				self._remember(radar_log_file, "physical", _toJSON(physical))
+				self._remember(radar_log_file, "physicalPrintout",
+					           out.getvalue())
+			self.physicals[radar_log_file] = physical
+		return self.physicals[radar_log_file]
+
+	"""
+	OUTPUT: get_radar_fov(radar_log_file), worked out at most once
+	"""
+	def fov(self, radar_log_file):
+		if radar_log_file not in self.fovs:
+			found, stuff = self._entry(radar_log_file, "fov")
+			if found:
+				fov = _fromJSON(FoV, stuff)
+			else:
+				fov = get_radar_fov(radar_log_file)
+				self._remember(radar_log_file, "fov", _toJSON(fov))
+			self.fovs[radar_log_file] = fov
+		return self.fovs[radar_log_file]
+
+	"""
+	Write newly resolved radars to the cache file, if there is one.  Other
+	processes (e.g. campaign.py's workers) may share the file, so under a lock
+	the file is read again, this process's new entries are merged in, and the
+	result is written then renamed into place.
+	"""
+	def save(self):
+		if self.cacheFile == None or not self.dirty:
+			return
+		folder = os.path.dirname(self.cacheFile)
+		if folder != "":
+			os.makedirs(folder, exist_ok=True)
+		with _locked(self.cacheFile + ".lock"):
+			stored = _readCache(self.cacheFile)
+			for (radar_log_file, fresh) in self.fresh.items():
+				entry = stored.get(radar_log_file)
+				if entry == None or entry["key"] != fresh["key"]:
+					entry = {}
+				entry.update(fresh)
+				stored[radar_log_file] = entry
+			# Write then rename, as in src/parseCache.py.
+			tmp = self.cacheFile + "." + str(os.getpid()) + ".tmp"
+			with open(tmp, "w") as fw:
+				fw.write(json.dumps(stored, indent=1))
+			os.replace(tmp, self.cacheFile)
+		self.stored = stored
+		self.fresh  = {}
+		self.dirty  = False
+
+# One resolver per process, shared by every TimeToDetect.
+RADAR_RESOLVER = RadarResolver()
+
+def getRadarResolver():
+	return RADAR_RESOLVER
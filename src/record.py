@@ -0,0 +1,31 @@
+"""
+file       : record.py
+author     : Max von Hippel
+authored   : 18 October 2026
+description: Base class for the small record classes (Point, FoV, FoVTest,
+             Physical, Encounter).  Subclasses list their fields in
+             __slots__, so an instance is a fixed row of pointers rather than
+             a dict.  Any other attribute still works, as before: it goes in
+             an instance __dict__ that is only created when first needed.
+"""
+class Record(object):
+
+	__slots__ = ("__dict__",)
+
+	"""
+	OUTPUT: { name : value } of every field that has been set, in declaration
+	        order.  This is what __dict__ held before the classes had slots.
+	"""
+	def asDict(self):
+		stuff = {}
+		for cls in reversed(type(self).__mro__):
+			for name in cls.__dict__.get("__slots__", ()):
+				if name in stuff or name == "__dict__":
+					continue
+				try:
+					stuff[name] = object.__getattribute__(self, name)
+				except AttributeError:
+					pass
+		stuff.update(self.__dict__)
+		return stuff
+
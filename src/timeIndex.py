@@ -0,0 +1,63 @@
+"""
+file    : timeIndex.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : A sorted copy of a stamp column plus the offsets back into the
+          original rows, so that "which rows fall between t0 and t1" and
+          "which row is closest to t" are binary searches instead of scans.
+"""
+import numpy as np
+
+"""
+INPUT : t - a datetime, datetime64 or anything np.datetime64 accepts
+OUTPUT: t as a datetime64[ns] scalar
+"""
+def toStamp64(t):
+	return np.datetime64(t, "ns")
+
+class TimeIndex(object):
+
+	"""
+	stamps - datetime64 array (or list of datetimes / None) to index
+	"""
+	def __init__(self, stamps):
+		stamps = np.asarray(stamps, dtype="datetime64[ns]")
+
+		# NaT sorts last, so missing stamps never fall inside a query.
+		self.order     = np.argsort(stamps, kind="stable")
+		self.sorted    = stamps[self.order]
+		self.monotonic = bool(np.all(self.order[1:] > self.order[:-1]))
+		self.stamped   = len(stamps) - int(np.count_nonzero(np.isnat(stamps)))
+
+	def __len__(self):
+		return len(self.sorted)
+
+	"""
+	INPUT : t0, t1 - the ends of the time window
+	        closed - whether the ends themselves are inside the window
+	OUTPUT: positions of the rows inside the window, in their original order;
+	        a slice when the indexed stamps were already sorted
+	"""
+	def between(self, t0, t1, closed=True):
+		lo = np.searchsorted(self.sorted, toStamp64(t0),
+			                 side="left"  if closed else "right")
+		hi = np.searchsorted(self.sorted, toStamp64(t1),
+			                 side="right" if closed else "left" )
+		hi = max(lo, hi)
+		if self.monotonic:
+			return slice(int(lo), int(hi))
+		return np.sort(self.order[lo:hi])
+
+	"""
+	OUTPUT: the position of the row whose stamp is closest to t (the earlier
+	        one on a tie), or None if nothing has a stamp
+	"""
+	def nearest(self, t):
+		n = self.stamped
+		if n == 0:
+			return None
+		t = toStamp64(t)
+		i = int(np.searchsorted(self.sorted[:n], t))
+		if i == n or (i > 0 and t - self.sorted[i - 1] <= self.sorted[i] - t):
+			i -= 1
+		return int(self.order[i])
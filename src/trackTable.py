@@ -0,0 +1,280 @@
+"""
+file    : trackTable.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : Columnar (NumPy-backed) storage for radar and truth tracks.  A table
+          keeps one array per field instead of one Point per sample.  Slicing,
+          boolean masks and grouping by source never build per-row objects;
+          rows only become Points when older code iterates over a table.
+"""
+import numpy as np
+
+from src.Point     import Point
+from src.timeIndex import TimeIndex
+
+"""
+INPUT : stamps - an array of datetime64 values
+OUTPUT: the same instants as a list of datetime objects (None for NaT)
+"""
+def toDatetimes(stamps):
+	return np.asarray(stamps).astype("datetime64[us]").tolist()
+
+def _floatsOrNone(column):
+	return [None if v != v else v for v in column.tolist()]
+
+class TrackTable(object):
+
+	# Float-valued columns, besides the stamp and src every table carries.
+	FLOAT_COLUMNS = ()
+
+	# String-valued columns.
+	TEXT_COLUMNS  = ()
+
+	"""
+	stamp    - datetime64[ns] array
+	srcCodes - int32 array, indexing into srcNames
+	srcNames - list of source (file) names
+	columns  - one array per name in FLOAT_COLUMNS and TEXT_COLUMNS; missing
+	           columns are filled with NaN / ""
+	"""
+	def __init__(self, stamp=None, srcCodes=None, srcNames=None, **columns):
+
+		self.stamp = np.asarray([] if stamp is None else stamp,
+			                    dtype="datetime64[ns]")
+
+		n = len(self.stamp)
+
+		self.srcCodes = np.zeros(n, dtype=np.int32) if srcCodes is None \
+		                else np.asarray(srcCodes, dtype=np.int32)
+
+		self.srcNames = [] if srcNames is None else list(srcNames)
+
+		# Built on first use by timeIndex(); tables are never modified in
+		# place, so it stays valid for the life of the table.
+		self._timeIndex = None
+
+		# Built on first use by srcRanges(), for the same reason.
+		self._srcRanges = None
+
+		for name in self.FLOAT_COLUMNS:
+			column = columns.get(name)
+			setattr(self, name, np.full(n, np.nan) if column is None else
+				                np.asarray(column, dtype=np.float64))
+
+		for name in self.TEXT_COLUMNS:
+			column = columns.get(name)
+			setattr(self, name, np.full(n, "") if column is None else
+				                np.asarray(column, dtype=str))
+
+	"""
+	Constructors
+	"""
+	@classmethod
+	def fromColumns(cls, src, stamp, **columns):
+		n = len(stamp)
+		return cls(stamp=stamp,
+			       srcCodes=np.zeros(n, dtype=np.int32),
+			       srcNames=[src],
+			       **columns)
+
+	@classmethod
+	def fromPoints(cls, points):
+		points   = list(points)
+		srcNames = []
+		codes    = {}
+		for p in points:
+			src = getattr(p, "src", None)
+			if src not in codes:
+				codes[src] = len(srcNames)
+				srcNames.append(src)
+		columns = {
+			name : [getattr(p, name, None) for p in points]
+			for name in cls.FLOAT_COLUMNS + cls.TEXT_COLUMNS
+		}
+		return cls(stamp=[getattr(p, "stamp", None) for p in points],
+			       srcCodes=[codes[getattr(p, "src", None)] for p in points],
+			       srcNames=srcNames,
+			       **columns)
+
+	@classmethod
+	def concat(cls, tables):
+		tables = [t for t in tables if t is not None]
+		if len(tables) == 0:
+			return cls()
+		if len(tables) == 1:
+			return tables[0]
+		srcNames = []
+		codes    = {}
+		srcCodes = []
+		for t in tables:
+			remap = np.empty(len(t.srcNames), dtype=np.int32)
+			for i, name in enumerate(t.srcNames):
+				if name not in codes:
+					codes[name] = len(srcNames)
+					srcNames.append(name)
+				remap[i] = codes[name]
+			srcCodes.append(remap[t.srcCodes])
+		columns = {
+			name : np.concatenate([getattr(t, name) for t in tables])
+			for name in cls.FLOAT_COLUMNS + cls.TEXT_COLUMNS
+		}
+		return cls(stamp=np.concatenate([t.stamp for t in tables]),
+			       srcCodes=np.concatenate(srcCodes),
+			       srcNames=srcNames,
+			       **columns)
+
+	"""
+	Plain-array form of the table (for np.savez and friends), and back.
+	"""
+	def toArrays(self):
+		arrays = {
+			"stamp"    : self.stamp,
+			"srcCodes" : self.srcCodes,
+			"srcNames" : np.asarray(self.srcNames, dtype=str)
+		}
+		for name in self.FLOAT_COLUMNS + self.TEXT_COLUMNS:
+			arrays[name] = getattr(self, name)
+		return arrays
+
+	@classmethod
+	def fromArrays(cls, arrays):
+		columns = {
+			name : arrays[name]
+			for name in cls.FLOAT_COLUMNS + cls.TEXT_COLUMNS
+		}
+		return cls(stamp=arrays["stamp"],
+			       srcCodes=arrays["srcCodes"],
+			       srcNames=arrays["srcNames"].tolist(),
+			       **columns)
+
+	"""
+	Access
+	"""
+	def __len__(self):
+		return len(self.stamp)
+
+	# Integers give a single row (as a Point); slices, boolean masks and index
+	# arrays give a new table of the same type.
+	def __getitem__(self, key):
+		if isinstance(key, (int, np.integer)):
+			return self.row(key)
+		return self.take(key)
+
+	def take(self, key):
+		columns = {
+			name : getattr(self, name)[key]
+			for name in self.FLOAT_COLUMNS + self.TEXT_COLUMNS
+		}
+		return type(self)(stamp=self.stamp[key],
+			              srcCodes=self.srcCodes[key],
+			              srcNames=self.srcNames,
+			              **columns)
+
+	def row(self, i):
+		p        = Point()
+		stamp    = self.stamp[i]
+		p.stamp  = None if np.isnat(stamp) else toDatetimes(stamp)
+		p.src    = self.srcNames[self.srcCodes[i]]
+		for name in self.FLOAT_COLUMNS:
+			v = float(getattr(self, name)[i])
+			setattr(p, name, None if v != v else v)
+		for name in self.TEXT_COLUMNS:
+			setattr(p, name, str(getattr(self, name)[i]))
+		return p
+
+	# Iterating materializes each row as a Point, for code that still works
+	# point-by-point.  Columns are converted once, not once per row.
+	def __iter__(self):
+		names   = ("stamp", "src") + self.FLOAT_COLUMNS + self.TEXT_COLUMNS
+		columns = [toDatetimes(self.stamp),
+		           [self.srcNames[c] for c in self.srcCodes.tolist()]] \
+		        + [_floatsOrNone(getattr(self, n)) for n in self.FLOAT_COLUMNS] \
+		        + [getattr(self, n).tolist()       for n in self.TEXT_COLUMNS ]
+		for values in zip(*columns):
+			p = Point()
+			for name, value in zip(names, values):
+				setattr(p, name, value)
+			yield p
+
+	def stamps(self):
+		return toDatetimes(self.stamp)
+
+	"""
+	Time queries, answered by binary search on a sorted copy of the stamps
+	"""
+	def timeIndex(self):
+		if self._timeIndex is None:
+			self._timeIndex = TimeIndex(self.stamp)
+		return self._timeIndex
+
+	"""
+	OUTPUT: the rows with t0 <= stamp <= t1 (or t0 < stamp < t1 if not closed),
+	        in table order
+	"""
+	def sliceTime(self, t0, t1, closed=True):
+		return self.take(self.timeIndex().between(t0, t1, closed))
+
+	"""
+	OUTPUT: the row (as a Point) closest in time to t, or None if empty
+	"""
+	def nearest(self, t):
+		i = self.timeIndex().nearest(t)
+		return None if i == None else self.row(i)
+
+	"""
+	OUTPUT: the names of the sources present in the table, in code order
+	"""
+	def srcs(self):
+		return [self.srcNames[c] for c in np.unique(self.srcCodes)]
+
+	"""
+	OUTPUT: (table, { src name : (start, end) }), where table holds the same
+	        rows sorted by source, then stamp (the table itself when they
+	        already are), and table[start:end] are the rows of one source
+	"""
+	def srcRanges(self):
+		if self._srcRanges is None:
+			order  = np.lexsort((self.stamp, self.srcCodes))
+			table  = self if np.all(order[1:] > order[:-1]) \
+			         else self.take(order)
+			codes  = table.srcCodes
+			splits = np.flatnonzero(np.diff(codes)) + 1
+			starts = [0] + splits.tolist()
+			ends   = splits.tolist() + [len(codes)]
+			ranges = {
+				self.srcNames[codes[s]] : (s, e)
+				for (s, e) in zip(starts, ends)
+				if e > s
+			}
+			self._srcRanges = (table, ranges)
+		return self._srcRanges
+
+	"""
+	OUTPUT: { src name : sub-table of the rows from that source, by stamp },
+	        each a view into one sorted copy of the table (see srcRanges)
+	"""
+	def groupBySrc(self):
+		(table, ranges) = self.srcRanges()
+		return { name : table[s:e] for (name, (s, e)) in ranges.items() }
+
+class RadarTable(TrackTable):
+
+	FLOAT_COLUMNS = ("confidence",
+	                 "latitude",
+	                 "longitude",
+	                 "altitude",
+	                 "distance",
+	                 "verticalVelocity",
+	                 "xVelocity",
+	                 "yVelocity",
+	                 "azimuth",
+	                 "elevation",
+	                 "range")
+
+	TEXT_COLUMNS  = ("trackID",)
+
+class TruthTable(TrackTable):
+
+	FLOAT_COLUMNS = ("latitude",
+	                 "longitude",
+	                 "altitude")
@@ -1,15 +1,19 @@
 from collections import OrderedDict
 from glob        import glob
 from datetime    import datetime
+from xml.etree   import ElementTree
 
 import ntpath
 import json
 
 from src.Data  import Data
-from src.Point import Point
-from _datetime import date
+from src.trackTable import TruthTable
+from src.ingest     import parseFiles
+from src.folderScan import scanFolder
 
-from src.dateParser import parseDate
+from src.dateParser import parseDates
+from src.jsonStream import iterJSONArray
+from src.nmeaDecoder import decodeNMEA
 
 
 class TruthData(Data):
@@ -21,7 +25,7 @@ class TruthData(Data):
 	# EXTRA FUNCTIONALITY ABOVE DATA CLASS
 	def union(self, otherTruth):
 				
-		new_points = self.points.union(otherTruth.getPoints())
+		new_points = TruthTable.concat([self.points, otherTruth.getPoints()])
 
 		return TruthData(folder=None, points=new_points)
 		
@@ -32,83 +36,64 @@ class ADSBData(TruthData):
 
 	# Should fill in the data from the folder
 	def fromFolder(self, folder):
-		points = set()
-		for file in glob(folder + "**/*adsb.log", recursive=True):
-			points = points.union(set(getADSBpoints(file)))
-		self.points = points
+		self.points = TruthTable.concat(parseFiles(
+			getADSBpoints,
+			scanFolder(folder).entries("adsb"),
+			self.workers,
+			self.cache))
 
 	def quickStats(self):
 		return "ADSB Quick Stats : [ " + str(len(self.points)) + " points ]"
 
 def getADSBpoints(adsb_file_name):
-	points = []
-	with open(adsb_file_name, "r") as fr:
-		stuff = json.loads(fr.read())
-		for entry in stuff:
-			(lat, lon, alt) = (entry["latDD"],  \
-							   entry["lonDD"], \
-							   entry["altitudeMM"])
-			alt = float(alt) / 1000 # mm -> m
-			time = parseDate(entry["timeStamp"])
-			if (lat, lon) != (0.0, 0.0):
-				p           = Point()
-				p.stamp     = time
-				p.latitude  = lat
-				p.longitude = lon
-				p.altitude  = alt
-				p.src       = adsb_file_name
-				points.append(p)
-
-	return points
+	stamps, lats, lons, alts = [], [], [], []
+	for entry in iterJSONArray(adsb_file_name):
+		(lat, lon, alt) = (entry["latDD"],  \
+						   entry["lonDD"], \
+						   entry["altitudeMM"])
+		alt = float(alt) / 1000 # mm -> m
+		time = entry["timeStamp"]
+		if (lat, lon) != (0.0, 0.0):
+			stamps.append(time)
+			lats  .append(lat )
+			lons  .append(lon )
+			alts  .append(alt )
+
+	return TruthTable.fromColumns(adsb_file_name,
+		                          parseDates(stamps),
+		                          latitude=lats,
+		                          longitude=lons,
+		                          altitude=alts)
 
 """
 NMEA
 """
-def getNMEAymd(file):
-	with open(file, "r") as fr:
-		for line in fr:
-			if "\"activated\":" in line:
-				rem = line.split("\"activated\":")[1]\
-				          .split("\"")[1]
-				ymd = rem.split("T")[0]
-				year, month, day = ymd.split("-")
-				return (int(year), int(month), int(day))
-	return None
-
 class NMEAData(TruthData):
 
 	# Should fill in the data from the folder
 	def fromFolder(self, folder, defaultYear=2021):
-		points = set()
-		for file in glob(folder + "**/*.nmea", recursive=True):
-			(year, month, day) = getNMEAymd(file)
-			points = points.union(getNMEApoints(file, date(year, month, day)))
-		self.points = points
+		self.points = TruthTable.concat(parseFiles(
+			getNMEApoints,
+			scanFolder(folder).entries("nmea"),
+			self.workers,
+			self.cache))
 
 	def quickStats(self):
 		return "NMEA Quick Stats : [ " + str(len(self.points)) + " points ]"
 	
 
-def getNMEApoints(nmea_file_name, date):
-	points = set()
-	with open(nmea_file_name, "r", encoding='utf-8') as fr:
-		for line in fr:
-			try:
-				p = Point()
-
-				msg  = pynmea2.parse(line)
-				
-				p.latitude  = msg.latitude
-				p.longitude = msg.longitude
-				p.altitude  = msg.altitude
-				p.stamp     = datetime.combine(date, msg.timestamp)
-				p.src       = nmea_file_name
-				points.add(p)
-
-			except:
-				# who cares :D
-				continue
-	return points
+"""
+INPUT : nmea_file_name - a ground-station NMEA log
+        date           - the UTC date of the first fix; by default it comes
+                         from the "activated" line in the log's header
+"""
+def getNMEApoints(nmea_file_name, date=None):
+	stamps, lats, lons, alts = decodeNMEA(nmea_file_name, date)
+	return TruthTable.fromColumns(nmea_file_name,
+		                          stamps,
+		                          latitude=lats,
+		                          longitude=lons,
+		                          altitude=alts)
 
 """
 GPX
@@ -117,66 +102,76 @@ class GPXData(TruthData):
 
 	# Should fill in the data from the folder
 	def fromFolder(self, folder):
-		points = set()
-		for file in glob(folder + "**/*.gpx", recursive=True):
-			points = points.union(set(getGPXpoints(file)))
-		self.points = points
+		self.points = TruthTable.concat(parseFiles(
+			getGPXpoints,
+			scanFolder(folder).entries("gpx"),
+			self.workers,
+			self.cache))
 
 	def quickStats(self):
 		return "GPX Quick Stats : [ " + str(len(self.points)) + " points ]"
 
+"""
+Tag name without its "{namespace}" prefix, so GPX 1.0, 1.1 and un-namespaced
+files all read the same.
+"""
+def _localName(tag):
+	return tag.rsplit("}", 1)[-1]
+
 def getGPXpoints(gpx_file_name):
-	points = set()
+	stamps, lats, lons, eles = [], [], [], []
 	"""
 	<trkpt lat="64.803741993382573" lon="-147.88129697553813">
 		<ele>147.69999999999999</ele>
 		<time>2021-01-29T01:06:56Z</time>
 	</trkpt>
-	"""
-	with open(gpx_file_name, "r") as fr:
-		lat, lon, ele, time = None, None, None, None
-		for line in fr:
-			
-			if "<trkpt" in line and (lat == None and \
-				                     lon == None and \
-				                     ele == None and \
-				                     time == None):
 
-				lat = float(line.split("lat=\"")[1].split("\"")[0])
-				lon = float(line.split("lon=\"")[1].split("\"")[0])
-			
-			elif "<ele" in line and (lat  != None and \
-				                     lon  != None and \
-				                     ele  == None and \
-				                     time == None):
+	The file is parsed incrementally; each <trkpt> is read when it closes and
+	then dropped from the tree, so memory stays flat however long the track
+	and whatever the whitespace / line layout.
+	"""
+	parents = []
+	for event, elem in ElementTree.iterparse(gpx_file_name,
+		                                     events=("start", "end")):
 
-				ele = float(line.split("<ele>")[1].split("</ele>")[0])
+		if event == "start":
+			parents.append(elem)
+			continue
 
-			elif "<time" in line and (lat  != None and \
-									  lon  != None and \
-									  ele  != None and \
-									  time == None):
+		parents.pop()
 
-				time = line.split("<time>")[1].split("</time>")[0]
-				time = parseDate(time)
+		if _localName(elem.tag) != "trkpt":
+			continue
 
-			if (lat != None and lon != None and ele != None and time != None):
+		ele, time = None, None
+		for child in elem:
+			name = _localName(child.tag)
+			if name == "ele":
+				ele  = child.text
+			elif name == "time":
+				time = child.text
 
-				p = Point()
+		lat = elem.get("lat")
+		lon = elem.get("lon")
 
-				p.stamp     = time
-				p.latitude  = lat
-				p.longitude = lon
-				p.altitude  = ele
-				p.src       = gpx_file_name
-				
-				# ^ review this; is the elevation the same as altitude? TODO
+		if lat != None and lon != None and ele != None and time != None:
 
-				points.add(p)
+			stamps.append(time.strip())
+			lats  .append(float(lat))
+			lons  .append(float(lon))
+			eles  .append(float(ele))
+			
+			# ^ review this; is the elevation the same as altitude? TODO
 
-				lat, lon, ele, time = None, None, None, None
+		elem.clear()
+		if len(parents) > 0:
+			parents[-1].remove(elem)
 
-	return points
+	return TruthTable.fromColumns(gpx_file_name,
+		                          parseDates(stamps),
+		                          latitude=lats,
+		                          longitude=lons,
+		                          altitude=eles)
 
 """
 MAVLINK
@@ -186,41 +181,39 @@ class MavlinkData(TruthData):
 
 	# Should fill in the data from the folder
 	def fromFolder(self, folder):
-		points = set()
-		for file in glob(folder + "**/*mavlink.log", recursive=True):
-			points = points.union(set(getMavlinkPoints(file)))
-		self.points = points
+		self.points = TruthTable.concat(parseFiles(
+			getMavlinkPoints,
+			scanFolder(folder).entries("mavlink"),
+			self.workers,
+			self.cache))
 
 	def quickStats(self):
 		return "Mavlink Quick Stats : [ " + str(len(self.points)) + " points ]"
 
 def getMavlinkPoints(mavlink_file_name):
-	points = []
+	stamps, lats, lons, alts = [], [], [], []
 	try:
-		with open(mavlink_file_name, "r") as fr:
-			stuff = json.loads(fr.read())
-			for entry in stuff:
-				(lat, lon, alt) = (entry["latitude"],  \
-								   entry["longitude"], \
-								   entry["altitude"])
-				lat, lon = mavlinkCoords(lat, lon)
-				alt = float(alt) / 100 # cm -> m
-				time = parseDate(entry["timeStamp"])
-				(velX, velY) = (entry["vx"], entry["vy"])
-				if (lat, lon, alt) != (0.0, 0.0, 0.0):
-					p = Point()
-
-					p.stamp     = time
-					p.latitude  = lat
-					p.longitude = lon
-					p.altitude  = alt
-					p.src       = mavlink_file_name
-	        
-					points.append(p)
-
-		return points
+		for entry in iterJSONArray(mavlink_file_name):
+			(lat, lon, alt) = (entry["latitude"],  \
+							   entry["longitude"], \
+							   entry["altitude"])
+			lat, lon = mavlinkCoords(lat, lon)
+			alt = float(alt) / 100 # cm -> m
+			time = entry["timeStamp"]
+			(velX, velY) = (entry["vx"], entry["vy"])
+			if (lat, lon, alt) != (0.0, 0.0, 0.0):
+				stamps.append(time)
+				lats  .append(lat )
+				lons  .append(lon )
+				alts  .append(alt )
+
+		return TruthTable.fromColumns(mavlink_file_name,
+			                          parseDates(stamps),
+			                          latitude=lats,
+			                          longitude=lons,
+			                          altitude=alts)
 	except Exception as e:
-		return []
+		return TruthTable()
 
 def fixBrokenMavlinkCoords(coord):
 	if "E" in str(coord):
@@ -0,0 +1,164 @@
+"""
+file    : test_TimeToDetect.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : TimeToDetect's batched FoV classification and encounter search must
+          give the same encounters and times to detect as the original
+          point-by-point code, including for a track that leaves the FoV
+          through its heading or elevation limits while staying in range.
+"""
+import numpy as np
+
+from datetime                   import timedelta
+from src.FoV                    import FoV
+from src.Physical               import Physical
+from src.radarData              import RadarData, is_point_in_fov
+from src.radarResolver          import getRadarResolver
+from src.trackTable             import RadarTable, TruthTable
+from src.truthData              import TruthData
+from src.questions.TimeToDetect import TimeToDetect
+from src.Encounter              import Encounter
+
+
+RADAR_LOG = "test-radar.log"
+
+
+# TimeToDetect with classify_in_fov and populate_encounter_list as they were
+# before either was batched.
+class BaselineTimeToDetect(TimeToDetect):
+
+    def classify_in_fov(self):
+
+        for _id, tpoint in enumerate(self.TD_):
+
+            fov_check = is_point_in_fov(self.RD_[0],
+                                        tpoint,
+                                        fov=self.RD_fov_,
+                                        physical=self.RD_physical_,
+                                        calculate_Az_El_when_out_of_range=False)
+
+            self.TD_[_id].fov_test = fov_check
+
+    def populate_encounter_list(self):
+
+        last_in_FoV = False
+
+        for _id, tpoint in enumerate(self.TD_):
+
+            if tpoint == None or tpoint.fov_test == None:
+                continue
+
+            if last_in_FoV is False and tpoint.fov_test.is_in_fov:
+
+                last_in_FoV = True
+
+                encounter_time = tpoint.stamp
+
+                nearby_truths = self.list_points_within_timerange(
+                    self.TD_, encounter_time, self.encounter_TD_grab_range)
+
+                nearby_radar_points = self.list_points_within_timerange(
+                    self.RD_, encounter_time, self.encounter_RD_grab_range)
+
+                self.encounter_list.append(Encounter(tpoint,
+                                                     nearby_radar_points,
+                                                     nearby_truths))
+
+            elif last_in_FoV and tpoint.fov_test.is_in_fov is False:
+
+                last_in_FoV = False
+
+
+def _radar():
+
+    physical = Physical()
+    physical.lat     = 65.0
+    physical.lon     = -147.0
+    physical.alt     = 200.0
+    physical.heading = 0.0
+    physical.pitch   = 0.0
+    physical.roll    = 0.0
+
+    fov = FoV()
+    fov.range = 3000.0
+    fov.AzMin = -60.0
+    fov.AzMax = 60.0
+    fov.ElMin = -40.0
+    fov.ElMax = 40.0
+
+    return physical, fov
+
+
+# A truth track that circles the radar well inside its range (so it leaves
+# the FoV only through the heading limits), then flies out of range and back,
+# and radar detections that trail it by a few seconds.
+def _data():
+
+    start   = np.datetime64("2021-01-27T20:00:00", "ns")
+    seconds = np.arange(0, 1800, 3)
+    stamps  = start + (seconds * 1e9).astype("timedelta64[ns]")
+
+    # meters north / east of the radar
+    radius = np.where(seconds < 1200, 1500.0, 1500.0 + (seconds - 1200) * 10.0)
+    radius = np.where(seconds > 1500, 4500.0 - (seconds - 1500) * 10.0, radius)
+    angle  = np.radians(seconds * 0.6)
+    north  = radius * np.cos(angle)
+    east   = radius * np.sin(angle)
+
+    lats = 65.0 + north / 111320.0
+    lons = -147.0 + east / (111320.0 * np.cos(np.radians(65.0)))
+    alts = np.full(len(seconds), 400.0)
+
+    truth = TruthTable.fromColumns("test-truth.gpx", stamps,
+                                   latitude=lats,
+                                   longitude=lons,
+                                   altitude=alts)
+
+    lag   = np.timedelta64(1, "s")
+    radar = RadarTable.fromColumns(RADAR_LOG, stamps[::2] + lag,
+                                   latitude=lats[::2],
+                                   longitude=lons[::2],
+                                   altitude=alts[::2])
+
+    return RadarData(points=radar), TruthData(points=truth)
+
+
+def _answers(cls):
+    RD, TD = _data()
+    answer = cls(RD, TD)
+    return ([e.TD_point.stamp for e in answer.encounter_list],
+            answer.time_to_detect,
+            answer)
+
+
+def test_encounters_and_ttd_match_the_original_loop():
+
+    physical, fov = _radar()
+    resolver = getRadarResolver()
+    resolver.physicals[RADAR_LOG] = physical
+    resolver.fovs     [RADAR_LOG] = fov
+
+    try:
+        (baseline_encounters, baseline_ttd, baseline) = \
+            _answers(BaselineTimeToDetect)
+        (encounters, ttd, batched) = _answers(TimeToDetect)
+    finally:
+        del resolver.physicals[RADAR_LOG]
+        del resolver.fovs     [RADAR_LOG]
+
+    # The track does leave the FoV through heading while in range ...
+    tests = [p.fov_test for p in baseline.TD_]
+    assert any(t.is_in_range and not t.is_in_fov for t in tests)
+    # ... and through range.
+    assert any(t.is_in_fov is False for t in tests)
+
+    # Same FoV answers, down to the type of each field.
+    for (old, new) in zip(tests, [p.fov_test for p in batched.TD_]):
+        assert old.asDict().keys() == new.asDict().keys()
+        for (name, value) in old.asDict().items():
+            assert type(getattr(new, name)) == type(value)
+            assert np.isclose(getattr(new, name), value)
+
+    assert len(baseline_encounters) > 0
+    assert encounters == baseline_encounters
+    assert ttd        == baseline_ttd
@@ -0,0 +1,71 @@
+"""
+file    : test_jsonStream.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : iterJSONArray must give exactly what json.load gives, however the
+          file happens to be cut into chunks, and must reject what json.load
+          rejects.
+"""
+import json
+import pytest
+
+from src.jsonStream import iterJSONArray
+
+
+# Numbers with fractions and exponents (which a chunk boundary can cut into
+# something that is itself a valid, shorter number), strings with escapes,
+# nested containers and uneven whitespace.
+ARRAY = """ [
+  {"timestamp": 1611781200.123456, "lat": 6.4852e1, "lon": -147.85E+0,
+   "alt": -1.5e-3, "id": 12, "name": "a \\"quoted\\", [bracketed] name"},
+  1.25 , 3e2,-0.0,  1E-7 ,
+  [ ], {}, [1, [2.5, {"x": null}]], true,false,null,
+  "\\u00e9t\\u00e9",   123456789012345678901234567890
+]
+"""
+
+MALFORMED = [
+    "",
+    "[",
+    "[1",
+    "[1,",
+    "[1,]",
+    "[,1]",
+    "[1,,2]",
+    "[1 2]",
+    "[1.]",
+    "[1] 2",
+    "[] x",
+]
+
+
+def _write(tmp_path, text):
+    path = tmp_path / "array.log"
+    path.write_text(text)
+    return str(path)
+
+
+@pytest.mark.parametrize("chunk_size", list(range(1, 17)) + [1 << 16])
+def test_any_chunk_size_gives_what_json_load_gives(tmp_path, chunk_size):
+    path = _write(tmp_path, ARRAY)
+    assert list(iterJSONArray(path, chunk_size)) == json.loads(ARRAY)
+
+
+def test_empty_array(tmp_path):
+    for chunk_size in (1, 2, 1 << 16):
+        assert list(iterJSONArray(_write(tmp_path, " [ ] \n"), chunk_size)) == []
+
+
+def test_rejects_a_file_that_is_not_an_array(tmp_path):
+    with pytest.raises(ValueError):
+        list(iterJSONArray(_write(tmp_path, ' {"a": [1]}')))
+
+
+@pytest.mark.parametrize("text", MALFORMED)
+def test_rejects_what_json_load_rejects(tmp_path, text):
+    path = _write(tmp_path, text)
+    with pytest.raises(ValueError):
+        json.loads(text)
+    for chunk_size in (1, 2, 3, 1 << 16):
+        with pytest.raises(ValueError):
+            list(iterJSONArray(path, chunk_size))
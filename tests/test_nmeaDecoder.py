@@ -0,0 +1,108 @@
+"""
+file    : test_nmeaDecoder.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : decodeNMEA against a small ground-station log: the date comes from
+          the "activated" header (or an RMC), moves forward at midnight, bad
+          checksums and fixless GGAs are dropped, and every fix kept decodes
+          to what pynmea2 makes of the same sentence.
+"""
+import datetime
+import numpy as np
+import pynmea2
+
+from functools       import reduce
+from src.nmeaDecoder import decodeNMEA
+
+
+def _sentence(body, checksum=None):
+    if checksum == None:
+        checksum = reduce(lambda acc, c : acc ^ ord(c), body, 0)
+    return "$" + body + "*" + "%02X" % checksum
+
+
+GGA = [
+    "GPGGA,235958.50,6450.9811,N,14750.3210,W,1,09,0.9,152.3,M,2.1,M,,",
+    "GPGGA,235959.75,6450.9825,N,14750.3188,W,1,09,0.9,,M,2.1,M,,",
+    "GPGGA,000000.25,6450.9840,N,14750.3165,W,1,09,0.9,152.9,M,2.1,M,,",
+    "GNGGA,000001.00,6450.9856,S,14750.3142,E,1,09,0.9,153.4,M,2.1,M,,",
+]
+
+# Fixes from a sentence type decodeNMEA leaves to pynmea2, which does not
+# convert its altitude field.
+GNS = [
+    "GNGNS,000002.00,6450.9870,N,14750.3120,W,AA,12,0.8,153.8,2.1,,",
+    "GNGNS,000003.00,6450.9884,N,14750.3098,W,AA,12,0.8,,2.1,,",
+]
+
+LOG = "\n".join([
+    '{',
+    '  "activated": "2021-01-27T15:04:05-09:00",',
+    '  "device": "ground station"',
+    '}',
+    _sentence(GGA[0]),
+    # no fix yet
+    _sentence("GPGGA,235959.00,,,,,0,00,99.9,,M,,M,,"),
+    # corrupted in transit
+    _sentence(GGA[1].replace("6450.9825", "6450.9826"),
+              reduce(lambda acc, c : acc ^ ord(c), GGA[1], 0)),
+    _sentence(GGA[1]),
+    "garbage $GPTXT,01,01,02,not a fix in sight",
+    _sentence(GGA[2]),
+    _sentence(GGA[3]),
+    _sentence(GNS[0]),
+    _sentence(GNS[1]),
+    ""
+])
+
+
+def _write(tmp_path, text):
+    path = tmp_path / "ground.nmea"
+    path.write_text(text)
+    return str(path)
+
+
+def test_fixes_match_pynmea2(tmp_path):
+
+    (stamps, lats, lons, alts) = decodeNMEA(_write(tmp_path, LOG))
+
+    expected = [pynmea2.parse(_sentence(s), check=True) for s in GGA + GNS]
+    assert len(stamps) == len(expected)
+
+    days = [datetime.date(2021, 1, 27)] * 2 + [datetime.date(2021, 1, 28)] * 4
+
+    for (i, (msg, day)) in enumerate(zip(expected, days)):
+        time  = msg.timestamp.replace(tzinfo=None)
+        stamp = np.datetime64(datetime.datetime.combine(day, time), "ns")
+        assert stamps[i] == stamp
+        assert lats[i] == msg.latitude
+        assert lons[i] == msg.longitude
+        if msg.altitude in (None, ""):
+            assert np.isnan(alts[i])
+        else:
+            assert alts[i] == float(msg.altitude)
+
+
+def test_rmc_gives_the_date_without_a_header(tmp_path):
+
+    text = "\n".join([
+        _sentence("GPRMC,235958.00,A,6450.9811,N,14750.3210,W,0.0,0.0,"
+                  "310121,,,A"),
+        _sentence(GGA[0]),
+        _sentence(GGA[2]),
+    ])
+
+    (stamps, _, _, _) = decodeNMEA(_write(tmp_path, text))
+
+    assert list(stamps) == [
+        np.datetime64("2021-01-31T23:59:58.50", "ns"),
+        np.datetime64("2021-02-01T00:00:00.25", "ns")
+    ]
+
+
+def test_fixes_before_any_date_are_dropped(tmp_path):
+    (stamps, _, _, _) = decodeNMEA(_write(tmp_path, _sentence(GGA[0])))
+    assert len(stamps) == 0
+    (stamps, _, _, _) = decodeNMEA(_write(tmp_path, _sentence(GGA[0])),
+                                   date="2021-01-27")
+    assert list(stamps) == [np.datetime64("2021-01-27T23:59:58.50", "ns")]
@@ -0,0 +1,144 @@
+"""
+file    : test_pacIndex.py
+author  : Max von Hippel
+authored: 18 October 2026
+purpose : pac_mask, PACIndex.test and PACIndex.query must give mathUtils.PAC's
+          answer for every radar point: with and without an incomplete truth
+          row, for radar points a hair either side of the horizontal limit, and
+          for both values of only_test_after_truth.
+"""
+import numpy as np
+import pytest
+
+from src.mathUtils  import PAC, distanceKM
+from src.pacIndex   import PACIndex, pac_mask
+from src.trackTable import RadarTable, TruthTable, toDatetimes
+
+
+HOZ  = 10   # meters
+VERT = 10   # meters
+DT   = 60   # seconds
+
+LAT  = 64.85
+LON  = -147.85
+
+# Where the truth point the boundary radar points are measured from sits,
+# well away from the rest of the track.
+EDGE_LAT = LAT + 0.01
+
+
+# The latitudes at which distanceKM first says a point due north of
+# (EDGE_LAT, LON) is more than meters from it: the last one within the limit
+# and the first one past it, as adjacent floats.
+def _edge(meters):
+    (inside, outside) = (EDGE_LAT, EDGE_LAT + 1e-3)
+    while np.nextafter(inside, outside) != outside:
+        middle = (inside + outside) / 2
+        if middle in (inside, outside):
+            break
+        if distanceKM(EDGE_LAT, LON, middle, LON) * 1000 > meters:
+            outside = middle
+        else:
+            inside = middle
+    return inside, outside
+
+
+def _tables(incomplete):
+
+    rng   = np.random.default_rng(7)
+    start = np.datetime64("2021-01-27T20:00:00", "us")
+
+    # A truth track wandering within ~40 m of (LAT, LON) for ten minutes.
+    n      = 120
+    tstamp = start + (np.sort(rng.uniform(0, 600, n)) * 1e6) \
+                     .astype("timedelta64[us]")
+    tlat   = LAT + rng.uniform(-4e-4, 4e-4, n)
+    tlon   = LON + rng.uniform(-8e-4, 8e-4, n)
+    talt   = 100 + rng.uniform(-15, 15, n)
+
+    # The first truth point is the one the boundary radar points below are
+    # measured from.
+    tstamp[0] = start
+    (tlat[0], tlon[0], talt[0]) = (EDGE_LAT, LON, 100.0)
+
+    # PAC gives up at an incomplete row.  (It also prints the row, which
+    # json.dumps can only do when the stamp is missing too.)
+    if incomplete:
+        tstamp[80] = np.datetime64("NaT")
+        talt  [80] = np.nan
+
+    truth = TruthTable.fromColumns("truth.gpx", tstamp.astype("datetime64[ns]"),
+                                   latitude=tlat, longitude=tlon, altitude=talt)
+
+    # Radar points scattered over the same area and time, ...
+    m      = 300
+    rstamp = start + (rng.uniform(-30, 660, m) * 1e6).astype("timedelta64[us]")
+    rlat   = LAT + rng.uniform(-5e-4, 5e-4, m)
+    rlon   = LON + rng.uniform(-1e-3, 1e-3, m)
+    ralt   = 100 + rng.uniform(-20, 20, m)
+
+    # ... plus pairs straddling the horizontal limit from truth point 0.
+    (inside, outside) = _edge(HOZ)
+    edge   = np.array([inside, outside, inside, outside])
+    rstamp = np.concatenate([rstamp, start + np.array(
+        [120, 120, -120, -120], dtype="timedelta64[s]").astype("timedelta64[us]")])
+    rlat   = np.concatenate([rlat, edge])
+    rlon   = np.concatenate([rlon, np.full(4, LON)])
+    ralt   = np.concatenate([ralt, np.full(4, 100.0)])
+
+    radar = RadarTable.fromColumns("radar.log", rstamp.astype("datetime64[ns]"),
+                                   latitude=rlat, longitude=rlon, altitude=ralt)
+
+    return radar, truth
+
+
+def _pac(radar, truth_points, only_after):
+    return np.array([
+        PAC(p.stamp, p.latitude, p.longitude, p.altitude, truth_points,
+            allowed_hoz_deviation=HOZ,
+            allowed_vertical_deviation=VERT,
+            allowed_time_deviation=DT,
+            only_test_after_truth=only_after)
+        for p in radar
+    ])
+
+
+def test_boundary_points_straddle_the_limit():
+    (inside, outside) = _edge(HOZ)
+    assert not distanceKM(EDGE_LAT, LON, inside,  LON) * 1000 > HOZ
+    assert     distanceKM(EDGE_LAT, LON, outside, LON) * 1000 > HOZ
+
+
+@pytest.mark.parametrize("incomplete", [False, True])
+@pytest.mark.parametrize("only_after", [True, False])
+def test_matches_PAC(incomplete, only_after):
+
+    (radar, truth) = _tables(incomplete)
+    truth_points   = list(truth)
+    expected       = _pac(radar, truth_points, only_after)
+
+    # The data exercise both answers, and each boundary pair splits.
+    assert expected.any() and not expected.all()
+    assert list(expected[-4:]) == [True, False, True, False]
+
+    (mask, match) = pac_mask(radar, truth, HOZ, VERT, DT, only_after)
+    assert (mask == expected).all()
+
+    # match is the truth row PAC stops at.
+    for i in np.flatnonzero(mask):
+        assert PAC(radar.row(i).stamp,
+                   radar.latitude[i], radar.longitude[i], radar.altitude[i],
+                   truth_points[match[i]:match[i] + 1],
+                   HOZ, VERT, DT, only_after)
+        assert not PAC(radar.row(i).stamp,
+                       radar.latitude[i], radar.longitude[i], radar.altitude[i],
+                       truth_points[:match[i]],
+                       HOZ, VERT, DT, only_after)
+
+    for index in (PACIndex(truth), PACIndex(truth_points)):
+        tested = index.test(radar.stamp, radar.latitude, radar.longitude,
+                            radar.altitude, HOZ, VERT, DT, only_after)
+        assert (tested == expected).all()
+        for (p, answer) in zip(radar, expected):
+            assert index.query(p.stamp, p.latitude, p.longitude, p.altitude,
+                               HOZ, VERT, DT, only_after) == answer